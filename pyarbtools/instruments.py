@@ -462,7 +462,7 @@ class M8190A(SignalGeneratorBase):
         self.query("*opc?")
         # IQ format is a little complex (hahaha)
         if wfmFormat.lower() == "iq":
-            if wfmData.dtype != np.complex:
+            if not np.iscomplexobj(wfmData):
                 raise TypeError("Invalid wfm type. IQ waveforms must be an array of complex values.")
             else:
                 i = self.check_wfm(np.real(wfmData))
@@ -1627,7 +1627,7 @@ class VSG(SignalGeneratorBase):
             raise TypeError("wfmData should be a complex NumPy array.")
 
         # Waveform format checking. VSGs can only use 'iq' format waveforms.
-        if wfmData.dtype != complex:
+        if not np.iscomplexobj(wfmData):
             raise TypeError("Invalid wfm type. IQ waveforms must be an array of complex values.")
         else:
             i = self.check_wfm(np.real(wfmData), bigEndian=bigEndian)
@@ -2142,7 +2142,7 @@ class VXG(SignalGeneratorBase):
         if not isinstance(wfmData, np.ndarray):
             raise TypeError("wfmData should be a complex NumPy array.")
 
-        if wfmData.dtype != complex:
+        if not np.iscomplexobj(wfmData):
             raise TypeError("Invalid wfm type. IQ waveforms must be an array of complex values.")
         else:
             i = self.check_wfm(np.real(wfmData))
@@ -5,16 +5,17 @@ Generic waveform creation capabilities for PyArbTools.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import scipy.signal as sig
 import scipy.io
+import scipy.fft
 import socketscpi
 import warnings
 from pyarbtools import error
 from fractions import Fraction
 import os
 import cmath
-from warnings import warn
+import functools
+from time import monotonic, sleep
 
 
 class WFM:
@@ -44,15 +45,19 @@ class WFM:
         self.wfmID = wfmID
         self.fileName = ""
 
-    def export(self, path="C:\\temp\\", vsaCompatible=False):
+    def export(self, path="C:\\temp\\", vsaCompatible=False, binary=False):
         """
         Exports waveform data to a csv file.
 
         Args:
             path (str): Absolute destination directory of the exported waveform (should end in '\').
             vsaCompatible (bool): Determines if header information will be included to ensure correct behavior when loading into VSA.
+            binary (bool): Export to a binary NumPy .npy file rather than csv. Much faster and smaller for long waveforms, but not compatible with VSA.
         """
 
+        if binary and vsaCompatible:
+            raise error.WfmBuilderError("VSA can't recall binary files. Set binary to False for VSA compatible exports.")
+
         if path[-1] != "\\":
             path += "\\"
 
@@ -61,20 +66,27 @@ class WFM:
         else:
             print("path not exist no")
 
-        self.fileName = path + self.wfmID + ".csv"
+        if binary:
+            self.fileName = path + self.wfmID + ".npy"
+        else:
+            self.fileName = path + self.wfmID + ".csv"
         print(self.fileName)
 
+        if binary:
+            # Raw binary skips the float to text conversion entirely and keeps the precision of the waveform data
+            np.save(self.fileName, self.data)
+            return
+
         try:
-            with open(self.fileName, "w") as f:
+            # 1 MB write buffer keeps the number of system calls low for long waveforms
+            with open(self.fileName, "w", buffering=2 ** 20) as f:
                 # f.write('# Waveform created with pyarbtools: https://github.com/morgan-at-keysight/pyarbtools')
                 if vsaCompatible:
                     f.write(f"XDelta, {1 / self.fs}\n")
                 if self.wfmFormat == "real":
-                    for d in self.data:
-                        f.write(f"{d}\n")
+                    _write_samples(f, self.data, iq=False)
                 elif self.wfmFormat == "iq":
-                    for d in self.data:
-                        f.write(f"{d.real}, {d.imag}\n")
+                    _write_samples(f, self.data, iq=True)
                 else:
                     raise error.WfmBuilderError('Invalid type for "data". Must be a NumPy array of complex or float.')
         except AttributeError:
@@ -108,7 +120,11 @@ class WFM:
         _, ext = os.path.splitext(fileName)
         if not ext == ".mat":
             raise IOError("File must have .mat extension")
-        matData = scipy.io.loadmat(fileName)
+        # Only read the target variable and optional metadata if possible, unrelated variables in the file can be large
+        matData = scipy.io.loadmat(fileName, variable_names=[targetVariable, "wfmID", "fs"])
+        if targetVariable not in matData:
+            # Everything has to be read in order to hunt for valid arrays
+            matData = scipy.io.loadmat(fileName)
 
         # Check which variables contain valid data
         data_vars = []
@@ -119,7 +135,7 @@ class WFM:
         else:
             # Eliminate boilerplate Matlab variables and check for valid NumPy arrays
             for key, value in matData.items():
-                if (key[:2] != "__" and key[-2:] != "__") and isinstance(value, np.ndarray) and value.size > 1:
+                if not (key.startswith("__") and key.endswith("__")) and isinstance(value, np.ndarray) and value.size > 1:
                     data_vars.append(key)
         # One array probably means a single complex array or a real array
         if len(data_vars) == 1:
@@ -129,13 +145,15 @@ class WFM:
             self.wfmFormat = "iq" if matData[var].dtype == np.dtype("complex") else "real"
         # 2 arrays probably means i and q have been separated
         elif len(data_vars) == 2:
-            if "i" in [k.lower() for k in matData.keys()] and "q" in [k.lower() for k in matData.keys()]:
-                i = matData["i"].flatten()
-                q = matData["q"].flatten()
+            # Map lowercase variable names to their actual names so 'I'/'Q' and 'i'/'q' are both found with one scan
+            lowerKeys = {k.lower(): k for k in matData}
+            if "i" in lowerKeys and "q" in lowerKeys:
+                i = matData[lowerKeys["i"]].ravel()
+                q = matData[lowerKeys["q"]].ravel()
                 if i.size != q.size:
                     raise error.WfmBuilderError("I and Q must contain same number of elements in mat file")
                 # Combine into single complex array
-                self.data = np.array(i + 1j * q)
+                self.data = _combine_iq(i, q)
                 self.wfmFormat = "iq"
             else:
                 raise error.WfmBuilderError("Need variables 'I' and 'Q' in .mat file")
@@ -165,13 +183,64 @@ class WFM:
     def plot_fft(self):
         """Plots the frequency domain representation of the waveform."""
 
-        freqData = np.abs(np.fft.fft(self.data))
-        freq = np.fft.fftfreq(len(freqData), 1 / self.fs)
+        # The spectrum of a real waveform is symmetrical, so only the positive half needs to be calculated
+        if self.wfmFormat == "real":
+            freqData = np.abs(scipy.fft.rfft(self.data))
+            freq = scipy.fft.rfftfreq(len(self.data), 1 / self.fs)
+        else:
+            freqData = np.abs(scipy.fft.fft(self.data))
+            freq = scipy.fft.fftfreq(len(freqData), 1 / self.fs)
+
+        # matplotlib is slow to import, so only load it when something is actually plotted
+        import matplotlib.pyplot as plt
+
         plt.plot(freq, freqData)
         plt.show()
 
 
-def export_wfm(data, fileName, vsaCompatible=False, fs=0):
+def _write_samples(f, data, iq):
+    """
+    Writes waveform samples to an open text file, one sample per line.
+    Samples are converted to Python floats and formatted in blocks so
+    memory use stays bounded for very long waveforms.
+
+    Args:
+        f (file object): Text file opened for writing.
+        data (NumPy array): Waveform samples.
+        iq (bool): Write each sample as 'I, Q' rather than a single real value.
+    """
+
+    blockSize = 2 ** 20
+    for start in range(0, len(data), blockSize):
+        block = data[start : start + blockSize]
+        if iq:
+            f.writelines(map("{}, {}\n".format, block.real.tolist(), block.imag.tolist()))
+        else:
+            f.writelines(map("{}\n".format, block.tolist()))
+
+
+def _combine_iq(i, q):
+    """
+    Combines separate I and Q sample arrays into a single complex array.
+    Each plane is written straight into the real and imaginary parts of
+    the result instead of building 1j * q as a temporary complex array.
+
+    Args:
+        i (NumPy array): In-phase samples.
+        q (NumPy array): Quadrature samples.
+
+    Returns:
+        (NumPy array): Complex waveform samples.
+    """
+
+    iq = np.empty(i.size, dtype=np.result_type(i, q, 1j))
+    iq.real = i
+    iq.imag = q
+
+    return iq
+
+
+def export_wfm(data, fileName, vsaCompatible=False, fs=0, binary=False):
     """
     Takes in waveform data and exports it to a file as plain text.
 
@@ -180,19 +249,28 @@ def export_wfm(data, fileName, vsaCompatible=False, fs=0):
         fileName (str): Absolute file name of the exported waveform.
         vsaCompatible (bool): Adds a header with 'XDelta' parameter for recall into VSA.
         fs (float): Sample rate used to create the waveform. Required if vsaCompatible is True.
+        binary (bool): Export to a binary NumPy .npy file rather than plain text. Much faster and smaller for long waveforms, but not compatible with VSA.
     """
 
+    if binary:
+        if vsaCompatible:
+            raise error.WfmBuilderError("VSA can't recall binary files. Set binary to False for VSA compatible exports.")
+        if not isinstance(data, np.ndarray) or data.dtype.kind not in "fc":
+            raise error.WfmBuilderError('Invalid type for "data". Must be a NumPy array of complex or float.')
+        # Raw binary skips the float to text conversion entirely and keeps the precision of the waveform data
+        np.save(fileName, data)
+        return
+
     try:
-        with open(fileName, "w") as f:
+        # 1 MB write buffer keeps the number of system calls low for long waveforms
+        with open(fileName, "w", buffering=2 ** 20) as f:
             # f.write('# Waveform created with pyarbtools: https://github.com/morgan-at-keysight/pyarbtools')
             if vsaCompatible:
                 f.write(f"XDelta, {1 / fs}\n")
-            if data.dtype == np.float64:
-                for d in data:
-                    f.write(f"{d}\n")
-            elif data.dtype == np.complex128:
-                for d in data:
-                    f.write(f"{d.real}, {d.imag}\n")
+            if data.dtype.kind == "f":
+                _write_samples(f, data, iq=False)
+            elif data.dtype.kind == "c":
+                _write_samples(f, data, iq=True)
             else:
                 raise error.WfmBuilderError('Invalid type for "data". Must be a NumPy array of complex or float.')
     except AttributeError:
@@ -228,7 +306,11 @@ def import_mat(fileName, targetVariable="data"):
     _, ext = os.path.splitext(fileName)
     if not ext == ".mat":
         raise IOError("File must have .mat extension")
-    matData = scipy.io.loadmat(fileName)
+    # Only read the target variable and optional metadata if possible, unrelated variables in the file can be large
+    matData = scipy.io.loadmat(fileName, variable_names=[targetVariable, "wfmID", "fs"])
+    if targetVariable not in matData:
+        # Everything has to be read in order to hunt for valid arrays
+        matData = scipy.io.loadmat(fileName)
 
     # Check which variables contain valid data
     data_vars = []
@@ -239,7 +321,7 @@ def import_mat(fileName, targetVariable="data"):
     else:
         # Eliminate boilerplate Matlab variables and check for valid NumPy arrays
         for key, value in matData.items():
-            if (key[:2] != "__" and key[-2:] != "__") and isinstance(value, np.ndarray) and value.size > 1:
+            if not (key.startswith("__") and key.endswith("__")) and isinstance(value, np.ndarray) and value.size > 1:
                 data_vars.append(key)
     # One array probably means a single complex array or a real array
     if len(data_vars) == 1:
@@ -249,13 +331,15 @@ def import_mat(fileName, targetVariable="data"):
         wfmFormat = "iq" if matData[var].dtype == np.dtype("complex") else "real"
     # 2 arrays probably means i and q have been separated
     elif len(data_vars) == 2:
-        if "i" in [k.lower() for k in matData.keys()] and "q" in [k.lower() for k in matData.keys()]:
-            i = matData["i"].flatten()
-            q = matData["q"].flatten()
+        # Map lowercase variable names to their actual names so 'I'/'Q' and 'i'/'q' are both found with one scan
+        lowerKeys = {k.lower(): k for k in matData}
+        if "i" in lowerKeys and "q" in lowerKeys:
+            i = matData[lowerKeys["i"]].ravel()
+            q = matData[lowerKeys["q"]].ravel()
             if i.size != q.size:
                 raise error.WfmBuilderError("I and Q must contain same number of elements in mat file")
             # Combine into single complex array
-            data = np.array(i + 1j * q)
+            data = _combine_iq(i, q)
             wfmFormat = "iq"
         else:
             raise error.WfmBuilderError("Need variables 'I' and 'Q' in .mat file")
@@ -299,7 +383,7 @@ def zero_generator(fs=100e6, numSamples=1024, wfmFormat="iq"):
         return real
 
 
-def sine_generator(fs=100e6, freq=0, phase=0, wfmFormat="iq", zeroLast=False):
+def sine_generator(fs=100e6, freq=0, phase=0, wfmFormat="iq", zeroLast=False, dtype=np.float64):
     """
     Generates a sine wave with optional frequency offset and initial
     phase at baseband or RF.
@@ -309,6 +393,8 @@ def sine_generator(fs=100e6, freq=0, phase=0, wfmFormat="iq", zeroLast=False):
         phase (float): Sine wave initial phase.
         wfmFormat (str): Selects waveform format. ('iq', 'real')
         zeroLast (bool): Allows user to force the last sample point to 0.
+        dtype (NumPy dtype): Floating point precision used to create the waveform (np.float64 or np.float32).
+            'iq' waveforms use the matching complex type.
 
     Returns:
         (NumPy array): Array containing the complex or real values of the waveform.
@@ -321,14 +407,20 @@ def sine_generator(fs=100e6, freq=0, phase=0, wfmFormat="iq", zeroLast=False):
         time = 100 / freq
     else:
         time = 10000 / fs
-    t = np.linspace(-time / 2, time / 2, int(time * fs), endpoint=False)
+    t = np.linspace(-time / 2, time / 2, int(time * fs), endpoint=False, dtype=dtype)
+    # Build the phase argument once and reuse its buffer rather than allocating a temporary for each operation
+    arg = t * (2 * np.pi * freq)
+    arg += phase
     if wfmFormat.lower() == "iq":
-        iq = np.exp(2 * np.pi * freq * 1j * t) + phase
+        # Write cos and sin straight into the real and imaginary parts instead of building 1j * arg for np.exp
+        iq = np.empty(len(t), dtype=np.result_type(dtype, np.complex64))
+        np.cos(arg, out=iq.real)
+        np.sin(arg, out=iq.imag)
         if zeroLast:
             iq[-1] = 0 + 1j * 0
         return iq
     elif wfmFormat.lower() == "real":
-        real = np.cos(2 * np.pi * freq * t + phase)
+        real = np.cos(arg, out=arg)
         if zeroLast:
             real[-1] = 0
         return real
@@ -362,16 +454,21 @@ def am_generator(fs=100e6, amDepth=50, modRate=100e3, cf=1e9, wfmFormat="iq", ze
     mod = (amDepth / 100) * np.sin(2 * np.pi * modRate * t) + 1
 
     if wfmFormat.lower() == "iq":
-        iq = mod * np.exp(1j * t)
-        sFactor = abs(np.amax(iq))
-        iq = iq / sFactor * 0.707
+        iq = np.empty(len(t), dtype=complex)
+        np.cos(t, out=iq.real)
+        np.sin(t, out=iq.imag)
+        iq *= mod
+        sFactor = np.abs(iq).max()
+        iq *= 0.707 / sFactor
         if zeroLast:
             iq[-1] = 0 + 1j * 0
         return iq
     elif wfmFormat.lower() == "real":
-        real = mod * np.cos(2 * np.pi * cf * t)
+        real = t * (2 * np.pi * cf)
+        np.cos(real, out=real)
+        real *= mod
         sFactor = np.amax(real)
-        real = real / sFactor
+        real /= sFactor
         if zeroLast:
             real[-1] = 0
         return real
@@ -379,6 +476,23 @@ def am_generator(fs=100e6, amDepth=50, modRate=100e3, cf=1e9, wfmFormat="iq", ze
         raise error.WfmBuilderError('Invalid waveform format selected. Choose "iq" or "real".')
 
 
+def _pulse_time_vector(fs, rl, dtype):
+    """
+    Creates the time vector used by the pulse generators, centered on
+    0 so modulation is symmetrical around the carrier.
+
+    Args:
+        fs (float): Sample rate used to create the signal.
+        rl (int): Number of samples in the pulse.
+        dtype (NumPy dtype): Floating point precision of the time vector.
+
+    Returns:
+        (NumPy array): Time vector.
+    """
+
+    return np.linspace(-rl / fs / 2, rl / fs / 2, rl, endpoint=False, dtype=dtype)
+
+
 def cw_pulse_generator(
     fs=100e6,
     pWidth=10e-6,
@@ -388,6 +502,7 @@ def cw_pulse_generator(
     wfmFormat="iq",
     zeroLast=False,
     ampScale=100,
+    dtype=np.float64,
 ):
     """
     Generates an unmodulated cw pulse at baseband or RF.
@@ -400,6 +515,8 @@ def cw_pulse_generator(
         wfmFormat (str): Waveform format. ('iq' or 'real')
         zeroLast (bool): Force the last sample point to 0.
         ampScale (int): Sets the linear voltage scaling of the waveform samples.
+        dtype (NumPy dtype): Floating point precision used to create the waveform (np.float64 or np.float32).
+            'iq' waveforms use the matching complex type.
 
     Returns:
         (NumPy array): Array containing the complex or real values of the waveform.
@@ -413,23 +530,29 @@ def cw_pulse_generator(
         raise error.WfmBuilderError("ampScale must be an integer between 1 and 100.")
 
     rl = int(fs * pWidth)
-    t = np.linspace(-rl / fs / 2, rl / fs / 2, rl, endpoint=False)
+    t = _pulse_time_vector(fs, rl, dtype)
+
+    # Allocate the whole PRI up front and write the pulse into the beginning of it, the rest is dead time
+    numSamples = rl + int(fs * pri - rl) if pri > pWidth else rl
 
     if wfmFormat.lower() == "iq":
-        iq = (ampScale / 100) * np.exp(2 * np.pi * freqOffset * 1j * t)
+        # Write cos and sin straight into the real and imaginary parts instead of building the np.exp argument
+        arg = t * (2 * np.pi * freqOffset)
+        iq = np.zeros(numSamples, dtype=np.result_type(dtype, np.complex64))
+        np.cos(arg, out=iq.real[:rl])
+        np.sin(arg, out=iq.imag[:rl])
+        iq[:rl] *= ampScale / 100
         if zeroLast:
-            iq[-1] = 0
-        if pri > pWidth:
-            deadTime = np.zeros(int(fs * pri - rl))
-            iq = np.append(iq, deadTime)
+            iq[rl - 1] = 0
 
         return iq
     elif wfmFormat.lower() == "real":
-        if pri <= pWidth:
-            real = (ampScale / 100) * np.cos(2 * np.pi * cf * t)
-        else:
-            deadTime = np.zeros(int(fs * pri - rl))
-            real = np.append(np.cos(2 * np.pi * (cf + freqOffset) * t), deadTime)
+        # Evaluate the carrier in place in the pulse portion of the buffer
+        real = np.zeros(numSamples, dtype=dtype)
+        pulse = real[:rl]
+        np.multiply(t, 2 * np.pi * (cf + freqOffset), out=pulse)
+        np.cos(pulse, out=pulse)
+        pulse *= ampScale / 100
 
         return real
     else:
@@ -444,6 +567,7 @@ def chirp_generator(
     cf=1e9,
     wfmFormat="iq",
     zeroLast=False,
+    dtype=np.float64,
 ):
     """
     Generates a symmetrical linear chirp at baseband or RF. Chirp direction
@@ -456,6 +580,9 @@ def chirp_generator(
         cf (float): Carrier frequency for real format waveforms.
         wfmFormat (str): Waveform format. ('iq', 'real')
         zeroLast (bool): Force the last sample point to 0.
+        dtype (NumPy dtype): Floating point precision used to create the waveform (np.float64 or np.float32).
+            'iq' waveforms use the matching complex type. Single precision is faster and half the size, but
+            loses phase accuracy for 'real' waveforms at high cf.
 
     Returns:
         (NumPy array): Array containing the complex or real values of the waveform.
@@ -474,7 +601,7 @@ def chirp_generator(
 
     rl = int(fs * pWidth)
     chirpRate = chirpBw / pWidth
-    t = np.linspace(-rl / fs / 2, rl / fs / 2, rl, endpoint=False)
+    t = _pulse_time_vector(fs, rl, dtype)
 
     """Direct phase manipulation was used to create the chirp modulation.
     https://en.wikipedia.org/wiki/Chirp#Linear
@@ -484,23 +611,32 @@ def chirp_generator(
     2*pi, but the math works out correctly. Just throw that into the complex
     exponential function and you're off to the races."""
 
-    mod = np.pi * chirpRate * t ** 2
+    # Allocate the whole PRI up front and write the chirp into the beginning of it, the rest is dead time
+    numSamples = rl + int(fs * pri - rl) if pri > pWidth else rl
+
     if wfmFormat.lower() == "iq":
-        iq = np.exp(1j * mod)
+        # Square and scale in place rather than allocating a temporary for each step
+        mod = t * t
+        mod *= np.pi * chirpRate
+
+        # Write cos and sin straight into the real and imaginary parts instead of building 1j * mod for np.exp
+        iq = np.zeros(numSamples, dtype=np.result_type(dtype, np.complex64))
+        np.cos(mod, out=iq.real[:rl])
+        np.sin(mod, out=iq.imag[:rl])
         if zeroLast:
-            iq[-1] = 0
-        if pri > pWidth:
-            deadTime = np.zeros(int(fs * pri - rl))
-            iq = np.append(iq, deadTime)
+            iq[rl - 1] = 0
 
         return iq
 
     elif wfmFormat.lower() == "real":
-        if pri <= pWidth:
-            real = np.cos(2 * np.pi * cf * t + mod)
-        else:
-            deadTime = np.zeros(int(fs * pri - rl))
-            real = np.append(np.cos(2 * np.pi * cf * t + mod), deadTime)
+        # Carrier plus chirp phase is t * (pi * chirpRate * t + 2 * pi * cf), evaluate it and the cosine in place
+        # This builds the whole phase in the output buffer without a separate array for the modulation
+        real = np.zeros(numSamples, dtype=dtype)
+        pulse = real[:rl]
+        np.multiply(t, np.pi * chirpRate, out=pulse)
+        pulse += 2 * np.pi * cf
+        pulse *= t
+        np.cos(pulse, out=pulse)
 
         return real
     else:
@@ -515,6 +651,7 @@ def barker_generator(
     cf=1e9,
     wfmFormat="iq",
     zeroLast=False,
+    dtype=np.float64,
 ):
     """
     Generates a Barker phase coded signal at baseband or RF.
@@ -527,6 +664,8 @@ def barker_generator(
         cf (float): Carrier frequency for real format waveforms.
         wfmFormat (str): Waveform format. ('iq', 'real')
         zeroLast (bool): Force the last sample point to 0.
+        dtype (NumPy dtype): Floating point precision used to create the waveform (np.float64 or np.float32).
+            'iq' waveforms use the matching complex type.
 
     Returns:
         (NumPy array): Array containing the complex or real values of the waveform.
@@ -547,40 +686,40 @@ def barker_generator(
         "b13": [1, 1, 1, 1, 1, -1, -1, 1, 1, -1, 1, -1, 1],
     }
 
-    # Create array for each phase shift and concatenate them
+    # Expand each phase shift to codeSamples samples in a single call
     codeSamples = int(pWidth / len(barkerCodes[code]) * fs)
     rl = codeSamples * len(barkerCodes[code])
-    barker = []
-    for p in barkerCodes[code]:
-        temp = np.full((codeSamples,), p)
-        barker = np.concatenate([barker, temp])
+    barker = np.repeat(np.asarray(barkerCodes[code], dtype=dtype), codeSamples)
+
+    # Allocate the whole PRI up front and write the pulse into the beginning of it, the rest is dead time
+    numSamples = rl + int(fs * pri - rl) if pri > pWidth else rl
 
-    mod = np.pi / 2 * barker
     if wfmFormat.lower() == "iq":
-        iq = np.exp(1j * mod)
+        # exp(1j * pi / 2 * +/-1) is just +/-1j, so skip the complex exponential entirely
+        iq = np.zeros(numSamples, dtype=np.result_type(dtype, np.complex64))
+        iq.imag[:rl] = barker
 
         if zeroLast:
-            iq[-1] = 0 + 0j
-        if pri > pWidth:
-            deadTime = np.zeros(int(fs * pri - rl))
-            iq = np.append(iq, deadTime)
+            iq[rl - 1] = 0 + 0j
         return iq
 
     elif wfmFormat.lower() == "real":
-        t = np.linspace(-rl / fs / 2, rl / fs / 2, rl, endpoint=False)
+        t = _pulse_time_vector(fs, rl, dtype)
 
-        if pri <= pWidth:
-            real = np.cos(2 * np.pi * cf * t + mod)
-        else:
-            deadTime = np.zeros(int(fs * pri - rl))
-            real = np.append(np.cos(2 * np.pi * cf * t + mod), deadTime)
+        # cos(x + pi / 2 * +/-1) is just -/+sin(x), so evaluate the carrier once and flip its sign per chip in place
+        real = np.zeros(numSamples, dtype=dtype)
+        pulse = real[:rl]
+        np.multiply(t, 2 * np.pi * cf, out=pulse)
+        np.sin(pulse, out=pulse)
+        pulse *= barker
+        np.negative(pulse, out=pulse)
 
         return real
     else:
         raise error.WfmBuilderError('Invalid waveform format selected. Choose "iq" or "real".')
 
 
-def multitone_generator(fs=100e6, spacing=1e6, num=11, phase="random", cf=1e9, wfmFormat="iq"):
+def multitone_generator(fs=100e6, spacing=1e6, num=11, phase="random", cf=1e9, wfmFormat="iq", dtype=np.float64):
     """
     IQTOOLS PLACES THE TONES IN THE FREQUENCY DOMAIN AND THEN IFFTS TO THE TIME DOMAIN
     Generates a multitone_generator signal with given tone spacing, number of
@@ -593,6 +732,8 @@ def multitone_generator(fs=100e6, spacing=1e6, num=11, phase="random", cf=1e9, w
             'zero', 'increasing', 'parabolic')
         cf (float): Carrier frequency for real format waveforms.
         wfmFormat (str): Waveform format. ('iq', 'real')
+        dtype (NumPy dtype): Floating point precision used to create the waveform (np.float64 or np.float32).
+            'iq' waveforms use the matching complex type.
 
     Returns:
         (NumPy array): Array containing the complex or real values of the waveform.
@@ -612,8 +753,9 @@ def multitone_generator(fs=100e6, spacing=1e6, num=11, phase="random", cf=1e9, w
         time = 2 / spacing
 
     # Create time vector and record length
-    # t = np.linspace(-time / 2, time / 2, int(time * fs), endpoint=False)
-    t = np.linspace(0, time, int(time * fs), endpoint=True)
+    # The time vector doesn't include the endpoint so the waveform wraps around seamlessly when played back in a loop
+    numSamples = int(time * fs)
+    t = np.linspace(0, time, numSamples, endpoint=False, dtype=dtype)
 
     # Define phase relationship
     if phase == "random":
@@ -630,23 +772,22 @@ def multitone_generator(fs=100e6, spacing=1e6, num=11, phase="random", cf=1e9, w
     if wfmFormat.lower() == "iq":
         # Freq domain method
         # time == 2 / freqSpacing or 1 / freqSpacing
-        numSamples = int(time * fs)
         freqToIndex = numSamples / fs
 
         toneFrequencies = np.arange(f, f + (num * spacing), spacing)
-        fdPhase = np.zeros(numSamples)
-        fdMag = np.zeros(numSamples)
 
-        tonePlacement = np.mod(toneFrequencies * freqToIndex + numSamples / 2, numSamples) + 1
-        tonePlacement = [int(t) for t in tonePlacement]
-        fdPhase[tonePlacement] = phaseArray
-        fdMag[tonePlacement] = 1
+        # Place the tones directly at their unshifted FFT bins (negative frequencies wrap to the top of the array)
+        # This skips the ifftshift copy; round before casting so float error can't truncate to the neighboring bin
+        tonePlacement = np.mod(np.round(toneFrequencies * freqToIndex).astype(np.intp), numSamples)
 
-        fdIQ = fdMag * np.exp(1j * fdPhase)
-        tdIQ = np.fft.ifft(np.fft.ifftshift(fdIQ)) * numSamples
+        # Only the tone bins are nonzero, so only evaluate the complex exponential for those
+        fdIQ = np.zeros(numSamples, dtype=np.result_type(dtype, np.complex64))
+        fdIQ[tonePlacement] = np.exp(1j * phaseArray)
+        # Forward normalization leaves the inverse transform unscaled, which saves multiplying by numSamples afterward
+        tdIQ = scipy.fft.ifft(fdIQ, norm="forward", overwrite_x=True)
 
-        sFactor = abs(np.amax(tdIQ))
-        tdIQ = tdIQ / sFactor * 0.707
+        sFactor = np.abs(tdIQ).max()
+        tdIQ *= 0.707 / sFactor
 
         # plt.subplot(211)
         # plt.plot(freqArray, fdPhase)
@@ -659,7 +800,7 @@ def multitone_generator(fs=100e6, spacing=1e6, num=11, phase="random", cf=1e9, w
 
         # # Time domain method
         # # Preallocate 2D array for tones
-        # tones = np.zeros((num, len(t)), dtype=np.complex)
+        # tones = np.zeros((num, len(t)), dtype=complex)
         #
         # # Create tones at each frequency and sum all together
         # for n in range(num):
@@ -683,18 +824,31 @@ def multitone_generator(fs=100e6, spacing=1e6, num=11, phase="random", cf=1e9, w
         #
         # return iq
     elif wfmFormat.lower() == "real":
-        # Preallocate 2D array for tones
-        tones = np.zeros((num, len(t)))
-
-        # Create tones at each frequency and sum all together
-        for n in range(num):
-            tones[n] = np.cos(2 * np.pi * (cf + f) * (t + phaseArray[n]))
-            f += spacing
-        real = tones.sum(axis=0)
+        toneFrequencies = cf + f + spacing * np.arange(num)
+        toneBins = toneFrequencies * numSamples / fs
+
+        # If every tone falls on an FFT bin below Nyquist, place the tones in the frequency domain and inverse FFT once
+        # This costs O(numSamples * log(numSamples)) regardless of the number of tones
+        onBins = np.allclose(toneBins, np.round(toneBins), rtol=0, atol=1e-6)
+        if onBins and 0 < toneBins.min() and toneBins.max() < numSamples / 2:
+            fdReal = np.zeros(numSamples // 2 + 1, dtype=np.result_type(dtype, np.complex64))
+            # Each cosine is split evenly between its positive and (implied) negative frequency bins
+            fdReal[np.round(toneBins).astype(int)] = 0.5 * np.exp(2j * np.pi * toneFrequencies * phaseArray)
+            real = scipy.fft.irfft(fdReal, n=numSamples, norm="forward", overwrite_x=True)
+        else:
+            # Accumulate one tone at a time into the output, reusing a single scratch buffer for each tone's phase
+            # This keeps memory use at two waveform lengths no matter how many tones there are
+            real = np.zeros(numSamples, dtype=dtype)
+            tone = np.empty(numSamples, dtype=dtype)
+            for w, p in zip((2 * np.pi * toneFrequencies).astype(dtype), phaseArray.astype(dtype)):
+                np.add(t, p, out=tone)
+                tone *= w
+                np.cos(tone, out=tone)
+                real += tone
 
         # Normalize and return values
-        sFactor = abs(np.amax(real))
-        real = real / sFactor
+        sFactor = np.abs(real).max()
+        real /= sFactor
 
         return real
     else:
@@ -714,7 +868,7 @@ def rrc_filter(alpha, length, osFactor, plot=False):
         (NumPy array): Filter coefficients for use in np.convolve.
     """
 
-    if alpha < 0 or alpha > 1.0:
+    if alpha <= 0 or alpha > 1.0:
         raise error.WfmBuilderError("Invalid 'alpha' chosen. Use something between 0.1 and 1.")
 
     filterOrder = length * osFactor
@@ -724,55 +878,90 @@ def rrc_filter(alpha, length, osFactor, plot=False):
     if filterOrder % 2:
         raise error.WfmBuilderError("Must use an even number of filter taps.")
 
+    t, h = _rrc_taps(float(alpha), filterOrder, osFactor)
+
+    if plot:
+        import matplotlib.pyplot as plt
+
+        plt.plot(t, h)
+        plt.title("Filter Impulse Response")
+        plt.ylabel("h(t)")
+        plt.xlabel("t")
+        plt.show()
+
+    # Return a copy so callers are free to modify it without corrupting the cached taps
+    return h.copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _rrc_taps(alpha, filterOrder, osFactor):
+    """
+    Calculates root raised cosine filter taps. Results are cached because
+    the same filter is typically designed over and over with identical
+    parameters and the design cost dwarfs a cache lookup.
+
+    Args:
+        alpha (float): Filter roll-off factor.
+        filterOrder (int): Total number of filter taps, must be even.
+        osFactor (int): Oversampling factor (number of samples per symbol).
+
+    Returns:
+        (tuple): Read-only NumPy arrays containing the time base and the filter coefficients.
+    """
+
     delay = filterOrder / 2
     t = np.arange(-delay, delay) / osFactor
 
-    # Calculate the impulse response without warning about the inevitable divide by zero operations
-    # I promise we will deal with those down the road
-    with np.errstate(divide="ignore", invalid="ignore"):
-        h = (
-            -4
-            * alpha
-            / osFactor
-            * (np.cos((1 + alpha) * np.pi * t) + np.sin((1 - alpha) * np.pi * t) / (4 * alpha * t))
-            / (np.pi * ((4 * alpha * t) ** 2 - 1))
-        )
-
-    # Find middle point of filter and manually populate the value
-    # np.where returns a list of indices where the argument condition is True in an array. Nice.
-    idx0 = np.where(t == 0)
-    h[idx0] = -1 / (np.pi * osFactor) * (np.pi * (alpha - 1) - 4 * alpha)
+    # The impulse response is even, so only evaluate the non-negative half and mirror it afterward
+    tHalf = np.arange(0, delay + 1) / osFactor
 
     # Define machine precision used to check for near-zero values for small-number arithmetic
     eps = np.finfo(float).eps
 
-    # Find locations of divide by zero points
-    divZero = abs(abs(4 * alpha * t) - 1)
-    # np.where returns a list of indices where the argument condition is True. Nice.
-    idx1 = np.where(divZero < np.sqrt(eps))
-
-    # Manually populate divide by zero points
-    h[idx1] = (
-        1
-        / (2 * np.pi * osFactor)
-        * (
-            np.pi * (alpha + 1) * np.sin(np.pi * (alpha + 1) / (4 * alpha))
-            - 4 * alpha * np.sin(np.pi * (alpha - 1) / (4 * alpha))
-            + np.pi * (alpha - 1) * np.cos(np.pi * (alpha - 1) / (4 * alpha))
+    # Find the middle point of the filter and the divide by zero points up front
+    center = tHalf == 0
+    divZero = abs(abs(4 * alpha * tHalf) - 1) < np.sqrt(eps)
+
+    # Closed form values of the center tap and the taps at t = +/- 1/(4 * alpha), which only exist for nonzero alpha
+    hCenter = -1 / (np.pi * osFactor) * (np.pi * (alpha - 1) - 4 * alpha)
+    if divZero.any():
+        hSingular = (
+            1
+            / (2 * np.pi * osFactor)
+            * (
+                np.pi * (alpha + 1) * np.sin(np.pi * (alpha + 1) / (4 * alpha))
+                - 4 * alpha * np.sin(np.pi * (alpha - 1) / (4 * alpha))
+                + np.pi * (alpha - 1) * np.cos(np.pi * (alpha - 1) / (4 * alpha))
+            )
         )
+    else:
+        hSingular = 0
+
+    # Fill in the closed form values and only evaluate the general expression at the remaining taps
+    # This way none of the divisions can hit zero
+    hHalf = np.empty_like(tHalf)
+    hHalf[center] = hCenter
+    hHalf[divZero] = hSingular
+    regular = ~(center | divZero)
+    tReg = tHalf[regular]
+    hHalf[regular] = (
+        -4
+        * alpha
+        / osFactor
+        * (np.cos((1 + alpha) * np.pi * tReg) + np.sin((1 - alpha) * np.pi * tReg) / (4 * alpha * tReg))
+        / (np.pi * ((4 * alpha * tReg) ** 2 - 1))
     )
 
+    # Mirror the positive half (t = delay ... 1) onto the negative half of the time base
+    h = np.concatenate((hHalf[:0:-1], hHalf[:-1]))
+
     # Normalize filter energy to 1
     h = h / np.sqrt(np.sum(h ** 2))
 
-    if plot:
-        plt.plot(t, h)
-        plt.title("Filter Impulse Response")
-        plt.ylabel("h(t)")
-        plt.xlabel("t")
-        plt.show()
+    t.setflags(write=False)
+    h.setflags(write=False)
 
-    return h
+    return t, h
 
 
 def rc_filter(alpha, length, L, plot=False):
@@ -789,20 +978,55 @@ def rc_filter(alpha, length, L, plot=False):
         (NumPy array): Filter coefficients for use in np.convolve.
     """
 
-    t = np.arange(-length / 2, length / 2 + 1 / L, 1 / L)  # +/- discrete-time base
-    with np.errstate(divide="ignore", invalid="ignore"):
-        A = np.divide(np.sin(np.pi * t), (np.pi * t))  # assume Tsym=1
-    B = np.divide(np.cos(np.pi * alpha * t), 1 - (2 * alpha * t) ** 2)
-    h = A * B
-    # Handle singularities
-    h[np.argwhere(np.isnan(h))] = 1  # singularity at p(t=0)
-    # singularity at t = +/- Tsym/2alpha
-    h[np.argwhere(np.isinf(h))] = (alpha / 2) * np.sin(np.divide(np.pi, (2 * alpha)))
+    h = _rc_taps(float(alpha), round(length * L), L)
 
     if plot:
+        import matplotlib.pyplot as plt
+
         plt.plot(h)
         plt.show()
 
+    # Return a copy so callers are free to modify it without corrupting the cached taps
+    return h.copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _rc_taps(alpha, numIntervals, L):
+    """
+    Calculates raised cosine filter taps. Results are cached because the
+    same filter is typically designed over and over with identical
+    parameters and the design cost dwarfs a cache lookup.
+
+    Args:
+        alpha (float): Filter roll-off factor.
+        numIntervals (int): Number of sample intervals spanned by the filter (filter length * L).
+        L (int): Oversampling factor (number of samples per symbol).
+
+    Returns:
+        (NumPy array): Read-only filter coefficients.
+    """
+
+    # +/- discrete-time base, built from integer sample indices so it is exactly symmetric around 0
+    t = (np.arange(numIntervals + 1) - numIntervals / 2) / L
+
+    # The impulse response is even, so only evaluate the non-negative half and mirror it afterward
+    mid = (numIntervals + 1) // 2
+    tHalf = t[mid:]
+    A = np.sinc(tHalf)  # assume Tsym=1, np.sinc handles the singularity at p(t=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        B = np.divide(np.cos(np.pi * alpha * tHalf), 1 - (2 * alpha * tHalf) ** 2)
+    hHalf = A * B
+    # Handle singularities
+    # singularity at t = +/- Tsym/2alpha, which only lands on the time base for some values of alpha
+    singular = np.isinf(hHalf)
+    if singular.any():
+        hHalf[singular] = (alpha / 2) * np.sin(np.pi / (2 * alpha))
+
+    # Mirror onto the negative half of the time base, skipping t = 0 if it's present
+    h = np.concatenate((hHalf[::-1][:mid], hHalf))
+
+    h.setflags(write=False)
+
     return h
 
 
@@ -827,30 +1051,112 @@ def rc_filter(alpha, length, L, plot=False):
 #     return time, h
 
 
-def bpsk_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+def _symbol_lut(symbolMap, bitsPerSym):
+    """
+    Converts a symbol map into a lookup table indexed by integer symbol value.
+
+    Args:
+        symbolMap (dict): Keys are strings containing the symbol's binary value, values are the symbol's location in the complex plane.
+        bitsPerSym (int): Number of bits per symbol.
+
+    Returns:
+        (NumPy array): Complex symbol locations. Symbols not defined in symbolMap are NaN.
+    """
+
+    lut = np.full(2 ** bitsPerSym, np.nan, dtype=complex)
+    for key, value in symbolMap.items():
+        if len(key) == bitsPerSym and set(key) <= {"0", "1"}:
+            lut[int(key, 2)] = value
+
+    return lut
+
+
+# MSB-first bit weights used to pack bits into symbol indices, built once for every symbol size that isn't packed
+# with np.packbits
+_BIT_WEIGHTS = {k: 1 << np.arange(k - 1, -1, -1) for k in range(1, 8)}
+
+
+def _map_symbols(data, bitsPerSym, lut, dtype=np.float64):
+    """
+    Groups bits into symbols and maps each symbol to a position on the
+    complex plane using an integer-indexed lookup table.
+
+    Args:
+        data (NumPy array): Array of bits (0 or 1). Trailing bits that don't fill a whole symbol are ignored.
+        bitsPerSym (int): Number of bits per symbol.
+        lut (NumPy array): Symbol lookup table created by _symbol_lut().
+        dtype (NumPy dtype): Floating point precision of the returned symbols (np.float64 or np.float32).
+
+    Returns:
+        (NumPy array): Array containing the complex symbol values.
+
+    Raises:
+        KeyError: If data contains values other than 0 and 1 or if a symbol in data is not defined in the lookup table.
+    """
+
+    bits = np.asarray(data)
+    bits = bits[: len(bits) // bitsPerSym * bitsPerSym].reshape(-1, bitsPerSym)
+
+    # Integer bits are validated with a min/max pass and packed as-is, avoiding a converted copy of the whole stream
+    if bits.dtype.kind in "biu":
+        if bits.size and (bits.min() < 0 or bits.max() > 1):
+            raise KeyError("Data must contain only 0 and 1.")
+    else:
+        if np.any((bits != 0) & (bits != 1)):
+            raise KeyError("Data must contain only 0 and 1.")
+        bits = bits.astype(np.intp)
+
+    # Pack each group of bits (MSB first) into an integer symbol index
+    # Byte-sized symbols map directly onto np.packbits, which is much faster than the weighted sum
+    if bitsPerSym == 8:
+        symbols = np.packbits(bits.astype(np.uint8, copy=False).ravel())
+    else:
+        symbols = bits @ _BIT_WEIGHTS[bitsPerSym]
+
+    # Undefined symbols are marked with NaN in the lookup table
+    # Converting the small table rather than the result keeps single precision to one pass over the symbols
+    values = lut.astype(np.result_type(dtype, np.complex64), copy=False)[symbols]
+    if np.isnan(values).any():
+        raise KeyError("Symbol not defined in symbol map.")
+
+    return values
+
+
+def bpsk_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for BPSK.
 
     customMap is a dict whos keys are strings containing the symbol's
     binary value and whos values are the symbol's location in the
     complex plane.
-    e.g. customMap = {'0101': 0.707 + 0.707j, ...}"""
+    e.g. customMap = {'0101': 0.707 + 0.707j, ...}
 
-    pattern = [str(d) for d in data]
-    if customMap:
-        bpskMap = customMap
-    else:
-        bpskMap = {"0": 1 + 0j, "1": -1 + 0j}
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively."""
+
+    if not customMap:
+        # The default BPSK map is just 1 - 2 * bit, so skip the string/dict machinery entirely
+        bits = np.asarray(data)
+        if np.any((bits != 0) & (bits != 1)):
+            raise ValueError("Invalid BPSK symbol value.")
+        return (1 - 2 * bits.astype(dtype)).astype(np.result_type(dtype, np.complex64))
 
     try:
-        return np.array([bpskMap[p] for p in pattern])
+        return _map_symbols(data, 1, _symbol_lut(customMap, 1), dtype)
     except KeyError:
         raise ValueError("Invalid BPSK symbol value.")
 
 
-def qpsk_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default QPSK constellation, indexed by symbol value
+_QPSK_LUT = _symbol_lut(
+    {"00": 1 + 1j, "01": -1 + 1j, "10": -1 - 1j, "11": 1 - 1j},
+    2,
+)
+
+
+def qpsk_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for QPSK.
 
@@ -858,22 +1164,40 @@ def qpsk_modulator(data, customMap=None):
     binary value and whos values are the symbol's location in the
     complex plane.
     e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively.
     """
 
-    pattern = [str(d0) + str(d1) for d0, d1 in zip(data[0::2], data[1::2])]
     if customMap:
-        qpskMap = customMap
+        lut = _symbol_lut(customMap, 2)
     else:
-        qpskMap = {"00": 1 + 1j, "01": -1 + 1j, "10": -1 - 1j, "11": 1 - 1j}
+        lut = _QPSK_LUT
 
     try:
-        return np.array([qpskMap[p] for p in pattern])
+        return _map_symbols(data, 2, lut, dtype)
     except KeyError:
         raise ValueError("Invalid QPSK symbol.")
 
 
-def psk8_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default 8-PSK constellation, indexed by symbol value
+_PSK8_LUT = _symbol_lut(
+    {
+        "000": 1 + 0j,
+        "001": 0.707 + 0.707j,
+        "010": 0 + 1j,
+        "011": -0.707 + 0.707j,
+        "100": -1 + 0j,
+        "101": -0.707 - 0.707j,
+        "110": 0 - 1j,
+        "111": 0.707 - 0.707j,
+    },
+    3,
+)
+
+
+def psk8_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for 8-PSK.
 
@@ -881,31 +1205,48 @@ def psk8_modulator(data, customMap=None):
     binary value and whos values are the symbol's location in the
     complex plane.
     e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively.
     """
 
-    pattern = [str(d0) + str(d1) + str(d2) for d0, d1, d2 in zip(data[0::3], data[1::3], data[2::3])]
     if customMap:
-        psk8Map = customMap
+        lut = _symbol_lut(customMap, 3)
     else:
-        psk8Map = {
-            "000": 1 + 0j,
-            "001": 0.707 + 0.707j,
-            "010": 0 + 1j,
-            "011": -0.707 + 0.707j,
-            "100": -1 + 0j,
-            "101": -0.707 - 0.707j,
-            "110": 0 - 1j,
-            "111": 0.707 - 0.707j,
-        }
+        lut = _PSK8_LUT
 
     try:
-        return np.array([psk8Map[p] for p in pattern])
+        return _map_symbols(data, 3, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 8PSK symbol.")
 
 
-def psk16_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default 16-PSK constellation, indexed by symbol value
+_PSK16_LUT = _symbol_lut(
+    {
+        "0000": 1 + 0j,
+        "0001": 0.923880 + 0.382683j,
+        "0010": 0.707107 + 0.707107j,
+        "0011": 0.382683 + 0.923880j,
+        "0100": 0 + 1j,
+        "0101": -0.382683 + 0.923880j,
+        "0110": -0.707107 + 0.707107j,
+        "0111": -0.923880 + 0.382683j,
+        "1000": -1 + 0j,
+        "1001": -0.923880 - 0.382683j,
+        "1010": -0.707107 - 0.707107j,
+        "1011": -0.382683 - 0.923880j,
+        "1100": 0 - 1j,
+        "1101": 0.382683 - 0.923880j,
+        "1110": 0.707107 - 0.707107j,
+        "1111": 0.923880 - 0.382683j,
+    },
+    4,
+)
+
+
+def psk16_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for 16-PSK.
 
@@ -913,43 +1254,33 @@ def psk16_modulator(data, customMap=None):
     binary value and whos values are the symbol's location in the
     complex plane.
     e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively.
     """
 
-    pattern = [str(d0) + str(d1) + str(d2) + str(d3) for d0, d1, d2, d3 in zip(data[0::4], data[1::4], data[2::4], data[3::4])]
     if customMap:
-        psk16Map = customMap
+        lut = _symbol_lut(customMap, 4)
     else:
-        psk16Map = {
-            "0000": 1 + 0j,
-            "0001": 0.923880 + 0.382683j,
-            "0010": 0.707107 + 0.707107j,
-            "0011": 0.382683 + 0.923880j,
-            "0100": 0 + 1j,
-            "0101": -0.382683 + 0.923880j,
-            "0110": -0.707107 + 0.707107j,
-            "0111": -0.923880 + 0.382683j,
-            "1000": -1 + 0j,
-            "1001": -0.923880 - 0.382683j,
-            "1010": -0.707107 - 0.707107j,
-            "1011": -0.382683 - 0.923880j,
-            "1100": 0 - 1j,
-            "1101": 0.382683 - 0.923880j,
-            "1110": 0.707107 - 0.707107j,
-            "1111": 0.923880 - 0.382683j,
-        }
+        lut = _PSK16_LUT
 
     try:
-        return np.array([psk16Map[p] for p in pattern])
+        return _map_symbols(data, 4, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 16PSK symbol.")
 
 
-def apsk16_modulator(data, ringRatio=2.53, customMap=None):
-    """Converts a list of bits to symbol values as strings, maps each
-    symbol value to a position on the complex plane, and returns an
-    array of complex values for 16 APSK.
+@functools.lru_cache(maxsize=32)
+def _apsk16_lut(ringRatio):
+    """
+    Builds the default 16 APSK lookup table. Results are cached because the
+    constellation only depends on the ring ratios.
 
-    https://public.ccsds.org/Pubs/131x2b1e1.pdf
+    Args:
+        ringRatio (float): Ratio of the outer ring radius to the inner ring radius.
+
+    Returns:
+        (NumPy array): Read-only complex symbol locations indexed by symbol value.
     """
 
     r1 = 1
@@ -958,12 +1289,8 @@ def apsk16_modulator(data, ringRatio=2.53, customMap=None):
     angle = 2 * np.pi / 12
     ao = angle / 2
 
-    pattern = [str(d0) + str(d1) + str(d2) + str(d3) for d0, d1, d2, d3 in zip(data[0::4], data[1::4], data[2::4], data[3::4])]
-
-    if customMap:
-        apsk16Map = customMap
-    else:
-        apsk16Map = {
+    lut = _symbol_lut(
+        {
             "0000": cmath.rect(r2, 2 * angle - ao),
             "0001": cmath.rect(r2, 3 * angle - ao),
             "0010": cmath.rect(r2, angle - ao),
@@ -980,20 +1307,48 @@ def apsk16_modulator(data, ringRatio=2.53, customMap=None):
             "1101": cmath.rect(r2, 9 * angle - ao),
             "1110": cmath.rect(r2, 7 * angle - ao),
             "1111": cmath.rect(r1, 8 * angle - ao),
-        }
+        },
+        4,
+    )
+    lut.setflags(write=False)
+
+    return lut
+
+
+def apsk16_modulator(data, ringRatio=2.53, customMap=None, dtype=np.float64):
+    """Converts a list of bits to integer symbol values, maps each
+    symbol value to a position on the complex plane, and returns an
+    array of complex values for 16 APSK.
+
+    https://public.ccsds.org/Pubs/131x2b1e1.pdf
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively.
+    """
+
+    if customMap:
+        lut = _symbol_lut(customMap, 4)
+    else:
+        lut = _apsk16_lut(float(ringRatio))
 
     try:
-        return np.array([apsk16Map[p] for p in pattern])
+        return _map_symbols(data, 4, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 16APSK symbol.")
 
 
-def apsk32_modulator(data, ring2Ratio=2.53, ring3Ratio=4.3, customMap=None):
-    """Converts a list of bits to symbol values as strings, maps each
-    symbol value to a position on the complex plane, and returns an
-    array of complex values for 32 APSK.
+@functools.lru_cache(maxsize=32)
+def _apsk32_lut(ring2Ratio, ring3Ratio):
+    """
+    Builds the default 32 APSK lookup table. Results are cached because the
+    constellation only depends on the ring ratios.
 
-    https://public.ccsds.org/Pubs/131x2b1e1.pdf
+    Args:
+        ring2Ratio (float): Ratio of the second ring radius to the inner ring radius.
+        ring3Ratio (float): Ratio of the third ring radius to the inner ring radius.
+
+    Returns:
+        (NumPy array): Read-only complex symbol locations indexed by symbol value.
     """
 
     r1 = 1
@@ -1004,15 +1359,8 @@ def apsk32_modulator(data, ring2Ratio=2.53, ring3Ratio=4.3, customMap=None):
     a2 = 2 * np.pi / 12
     a2offset = a2 / 2
 
-    pattern = [
-        str(d0) + str(d1) + str(d2) + str(d3) + str(d4)
-        for d0, d1, d2, d3, d4 in zip(data[0::5], data[1::5], data[2::5], data[3::5], data[4::5])
-    ]
-
-    if customMap:
-        apsk32Map = customMap
-    else:
-        apsk32Map = {
+    lut = _symbol_lut(
+        {
             "00000": cmath.rect(r2, 2 * a2 - a2offset),
             "00001": cmath.rect(r2, a2 - a2offset),
             "00010": cmath.rect(r3, a3),
@@ -1045,20 +1393,49 @@ def apsk32_modulator(data, ring2Ratio=2.53, ring3Ratio=4.3, customMap=None):
             "11101": cmath.rect(r1, 8 * a2 - a2offset),
             "11110": cmath.rect(r3, 10 * a3),
             "11111": cmath.rect(r3, 11 * a3),
-        }
+        },
+        5,
+    )
+    lut.setflags(write=False)
+
+    return lut
+
+
+def apsk32_modulator(data, ring2Ratio=2.53, ring3Ratio=4.3, customMap=None, dtype=np.float64):
+    """Converts a list of bits to integer symbol values, maps each
+    symbol value to a position on the complex plane, and returns an
+    array of complex values for 32 APSK.
+
+    https://public.ccsds.org/Pubs/131x2b1e1.pdf
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively.
+    """
+
+    if customMap:
+        lut = _symbol_lut(customMap, 5)
+    else:
+        lut = _apsk32_lut(float(ring2Ratio), float(ring3Ratio))
 
     try:
-        return np.array([apsk32Map[p] for p in pattern])
+        return _map_symbols(data, 5, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 32APSK symbol.")
 
 
-def apsk64_modulator(data, ring2Ratio=2.73, ring3Ratio=4.52, ring4Ratio=6.31, customMap=None):
-    """Converts a list of bits to symbol values as strings, maps each
-    symbol value to a position on the complex plane, and returns an
-    array of complex values for 64 APSK.
+@functools.lru_cache(maxsize=32)
+def _apsk64_lut(ring2Ratio, ring3Ratio, ring4Ratio):
+    """
+    Builds the default 64 APSK lookup table. Results are cached because the
+    constellation only depends on the ring ratios.
 
-    https://public.ccsds.org/Pubs/131x2b1e1.pdf
+    Args:
+        ring2Ratio (float): Ratio of the second ring radius to the inner ring radius.
+        ring3Ratio (float): Ratio of the third ring radius to the inner ring radius.
+        ring4Ratio (float): Ratio of the fourth ring radius to the inner ring radius.
+
+    Returns:
+        (NumPy array): Read-only complex symbol locations indexed by symbol value.
     """
 
     r1 = 1
@@ -1073,15 +1450,8 @@ def apsk64_modulator(data, ring2Ratio=2.73, ring3Ratio=4.52, ring4Ratio=6.31, cu
     a2 = 2 * np.pi / 12
     a2offset = a2 / 2
 
-    pattern = [
-        str(d0) + str(d1) + str(d2) + str(d3) + str(d4) + str(d5)
-        for d0, d1, d2, d3, d4, d5 in zip(data[0::6], data[1::6], data[2::6], data[3::6], data[4::6], data[5::6])
-    ]
-
-    if customMap:
-        apsk64Map = customMap
-    else:
-        apsk64Map = {
+    lut = _symbol_lut(
+        {
             "000000": cmath.rect(r4, a4 - a4offset),
             "000001": cmath.rect(r4, 2 * a4 - a4offset),
             "000010": cmath.rect(r3, a3 - a3offset),
@@ -1146,16 +1516,62 @@ def apsk64_modulator(data, ring2Ratio=2.73, ring3Ratio=4.52, ring4Ratio=6.31, cu
             "111101": cmath.rect(r3, 15 * a3 - a3offset),
             "111110": cmath.rect(r4, 20 * a4 - a4offset),
             "111111": cmath.rect(r3, 14 * a3 - a3offset),
-        }
+        },
+        6,
+    )
+    lut.setflags(write=False)
+
+    return lut
+
+
+def apsk64_modulator(data, ring2Ratio=2.73, ring3Ratio=4.52, ring4Ratio=6.31, customMap=None, dtype=np.float64):
+    """Converts a list of bits to integer symbol values, maps each
+    symbol value to a position on the complex plane, and returns an
+    array of complex values for 64 APSK.
+
+    https://public.ccsds.org/Pubs/131x2b1e1.pdf
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively.
+    """
+
+    if customMap:
+        lut = _symbol_lut(customMap, 6)
+    else:
+        lut = _apsk64_lut(float(ring2Ratio), float(ring3Ratio), float(ring4Ratio))
 
     try:
-        return np.array([apsk64Map[p] for p in pattern])
+        return _map_symbols(data, 6, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 64APSK symbol.")
 
 
-def qam16_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default 16 QAM constellation, indexed by symbol value
+_QAM16_LUT = _symbol_lut(
+    {
+        "0000": -3 - 3j,
+        "0001": -3 - 1j,
+        "0010": -3 + 3j,
+        "0011": -3 + 1j,
+        "0100": -1 - 3j,
+        "0101": -1 - 1j,
+        "0110": -1 + 3j,
+        "0111": -1 + 1j,
+        "1000": 3 - 3j,
+        "1001": 3 - 1j,
+        "1010": 3 + 3j,
+        "1011": 3 + 1j,
+        "1100": 1 - 3j,
+        "1101": 1 - 1j,
+        "1110": 1 + 3j,
+        "1111": 1 + 1j,
+    },
+    4,
+)
+
+
+def qam16_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for 16 QAM.
 
@@ -1167,38 +1583,63 @@ def qam16_modulator(data, customMap=None):
     customMap is a dict whos keys are strings containing the symbol's
     binary value and whos values are the symbol's location in the
     complex plane.
-    e.g. customMap = {'0101': 0.707 + 0.707j, ...}"""
+    e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively."""
 
-    pattern = [str(d0) + str(d1) + str(d2) + str(d3) for d0, d1, d2, d3 in zip(data[0::4], data[1::4], data[2::4], data[3::4])]
     if customMap:
-        qamMap = customMap
+        lut = _symbol_lut(customMap, 4)
     else:
-        qamMap = {
-            "0000": -3 - 3j,
-            "0001": -3 - 1j,
-            "0010": -3 + 3j,
-            "0011": -3 + 1j,
-            "0100": -1 - 3j,
-            "0101": -1 - 1j,
-            "0110": -1 + 3j,
-            "0111": -1 + 1j,
-            "1000": 3 - 3j,
-            "1001": 3 - 1j,
-            "1010": 3 + 3j,
-            "1011": 3 + 1j,
-            "1100": 1 - 3j,
-            "1101": 1 - 1j,
-            "1110": 1 + 3j,
-            "1111": 1 + 1j,
-        }
+        lut = _QAM16_LUT
     try:
-        return np.array([qamMap[p] for p in pattern])
+        return _map_symbols(data, 4, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 16 QAM symbol.")
 
 
-def qam32_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default 32 QAM constellation, indexed by symbol value
+_QAM32_LUT = _symbol_lut(
+    {
+        "00000": -3 + 5j,
+        "00001": -5 - 1j,
+        "00010": 3 + 3j,
+        "00011": -3 - 1j,
+        "00100": -5 + 3j,
+        "00101": 3 - 1j,
+        "00110": -1 + 1j,
+        "00111": -3 - 5j,
+        "01000": 1 + 5j,
+        "01001": -1 - 1j,
+        "01010": -5 + 1j,
+        "01011": 3 - 3j,
+        "01100": -1 + 3j,
+        "01101": -5 - 3j,
+        "01110": 3 + 1j,
+        "01111": 1 - 5j,
+        "10000": -1 + 5j,
+        "10001": -3 - 1j,
+        "10010": 5 + 3j,
+        "10011": 1 - 3j,
+        "10100": -3 + 3j,
+        "10101": 5 - 1j,
+        "10110": 1 + 1j,
+        "10111": -1 - 5j,
+        "11000": 3 + 5j,
+        "11001": 1 - 1j,
+        "11010": -3 + 1j,
+        "11011": 5 - 3j,
+        "11100": 1 + 3j,
+        "11101": -3 - 3j,
+        "11110": 5 + 1j,
+        "11111": 3 - 3j,
+    },
+    5,
+)
+
+
+def qam32_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for 32 QAM.
 
@@ -1209,57 +1650,95 @@ def qam32_modulator(data, customMap=None):
     customMap is a dict whos keys are strings containing the symbol's
     binary value and whos values are the symbol's location in the
     complex plane.
-    e.g. customMap = {'0101': 0.707 + 0.707j, ...}"""
+    e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively."""
 
-    pattern = [
-        str(d0) + str(d1) + str(d2) + str(d3) + str(d4)
-        for d0, d1, d2, d3, d4 in zip(data[0::5], data[1::5], data[2::5], data[3::5], data[4::5])
-    ]
     if customMap:
-        qamMap = customMap
+        lut = _symbol_lut(customMap, 5)
     else:
-        qamMap = {
-            "00000": -3 + 5j,
-            "00001": -5 - 1j,
-            "00010": 3 + 3j,
-            "00011": -3 - 1j,
-            "00100": -5 + 3j,
-            "00101": 3 - 1j,
-            "00110": -1 + 1j,
-            "00111": -3 - 5j,
-            "01000": 1 + 5j,
-            "01001": -1 - 1j,
-            "01010": -5 + 1j,
-            "01011": 3 - 3j,
-            "01100": -1 + 3j,
-            "01101": -5 - 3j,
-            "01110": 3 + 1j,
-            "01111": 1 - 5j,
-            "10000": -1 + 5j,
-            "10001": -3 - 1j,
-            "10010": 5 + 3j,
-            "10011": 1 - 3j,
-            "10100": -3 + 3j,
-            "10101": 5 - 1j,
-            "10110": 1 + 1j,
-            "10111": -1 - 5j,
-            "11000": 3 + 5j,
-            "11001": 1 - 1j,
-            "11010": -3 + 1j,
-            "11011": 5 - 3j,
-            "11100": 1 + 3j,
-            "11101": -3 - 3j,
-            "11110": 5 + 1j,
-            "11111": 3 - 3j,
-        }
+        lut = _QAM32_LUT
     try:
-        return np.array([qamMap[p] for p in pattern])
+        return _map_symbols(data, 5, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 32 QAM symbol.")
 
 
-def qam64_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default 64 QAM constellation, indexed by symbol value
+_QAM64_LUT = _symbol_lut(
+    {
+        "000000": 7 + 7j,
+        "000001": 7 + 5j,
+        "000010": 5 + 7j,
+        "000011": 5 + 5j,
+        "000100": 7 + 1j,
+        "000101": 7 + 3j,
+        "000110": 5 + 1j,
+        "000111": 5 + 3j,
+        "001000": 1 + 7j,
+        "001001": 1 + 5j,
+        "001010": 3 + 7j,
+        "001011": 3 + 5j,
+        "001100": 1 + 1j,
+        "001101": 1 + 3j,
+        "001110": 3 + 1j,
+        "001111": 3 + 3j,
+        "010000": 7 - 7j,
+        "010001": 7 - 5j,
+        "010010": 5 - 7j,
+        "010011": 5 - 5j,
+        "010100": 7 - 1j,
+        "010101": 7 - 3j,
+        "010110": 5 - 1j,
+        "010111": 5 - 3j,
+        "011000": 1 - 7j,
+        "011001": 1 - 5j,
+        "011010": 3 - 7j,
+        "011011": 3 - 5j,
+        "011100": 1 - 1j,
+        "011101": 1 - 3j,
+        "011110": 3 - 1j,
+        "011111": 3 - 3j,
+        "100000": -7 + 7j,
+        "100001": -7 + 5j,
+        "100010": -5 + 7j,
+        "100011": -5 + 5j,
+        "100100": -7 + 1j,
+        "100101": -7 + 3j,
+        "100110": -5 + 1j,
+        "100111": -5 + 3j,
+        "101000": -1 + 7j,
+        "101001": -1 + 5j,
+        "101010": -3 + 7j,
+        "101011": -3 + 5j,
+        "101100": -1 + 1j,
+        "101101": -1 + 3j,
+        "101110": -3 + 1j,
+        "101111": -3 + 3j,
+        "110000": -7 - 7j,
+        "110001": -7 - 5j,
+        "110010": -5 - 7j,
+        "110011": -5 - 5j,
+        "110100": -7 - 1j,
+        "110101": -7 - 3j,
+        "110110": -5 - 1j,
+        "110111": -5 - 3j,
+        "111000": -1 - 7j,
+        "111001": -1 - 5j,
+        "111010": -3 - 7j,
+        "111011": -3 - 5j,
+        "111100": -1 - 1j,
+        "111101": -1 - 3j,
+        "111110": -3 - 1j,
+        "111111": -3 - 3j,
+    },
+    6,
+)
+
+
+def qam64_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for 64 QAM.
 
@@ -1270,89 +1749,159 @@ def qam64_modulator(data, customMap=None):
     customMap is a dict whos keys are strings containing the symbol's
     binary value and whos values are the symbol's location in the
     complex plane.
-    e.g. customMap = {'0101': 0.707 + 0.707j, ...}"""
+    e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively."""
 
-    pattern = [
-        str(d0) + str(d1) + str(d2) + str(d3) + str(d4) + str(d5)
-        for d0, d1, d2, d3, d4, d5 in zip(data[0::6], data[1::6], data[2::6], data[3::6], data[4::6], data[5::6])
-    ]
     if customMap:
-        qamMap = customMap
+        lut = _symbol_lut(customMap, 6)
     else:
-        qamMap = {
-            "000000": 7 + 7j,
-            "000001": 7 + 5j,
-            "000010": 5 + 7j,
-            "000011": 5 + 5j,
-            "000100": 7 + 1j,
-            "000101": 7 + 3j,
-            "000110": 5 + 1j,
-            "000111": 5 + 3j,
-            "001000": 1 + 7j,
-            "001001": 1 + 5j,
-            "001010": 3 + 7j,
-            "001011": 3 + 5j,
-            "001100": 1 + 1j,
-            "001101": 1 + 3j,
-            "001110": 3 + 1j,
-            "001111": 3 + 3j,
-            "010000": 7 - 7j,
-            "010001": 7 - 5j,
-            "010010": 5 - 7j,
-            "010011": 5 - 5j,
-            "010100": 7 - 1j,
-            "010101": 7 - 3j,
-            "010110": 5 - 1j,
-            "010111": 5 - 3j,
-            "011000": 1 - 7j,
-            "011001": 1 - 5j,
-            "011010": 3 - 7j,
-            "011011": 3 - 5j,
-            "011100": 1 - 1j,
-            "011101": 1 - 3j,
-            "011110": 3 - 1j,
-            "011111": 3 - 3j,
-            "100000": -7 + 7j,
-            "100001": -7 + 5j,
-            "100010": -5 + 7j,
-            "100011": -5 + 5j,
-            "100100": -7 + 1j,
-            "100101": -7 + 3j,
-            "100110": -5 + 1j,
-            "100111": -5 + 3j,
-            "101000": -1 + 7j,
-            "101001": -1 + 5j,
-            "101010": -3 + 7j,
-            "101011": -3 + 5j,
-            "101100": -1 + 1j,
-            "101101": -1 + 3j,
-            "101110": -3 + 1j,
-            "101111": -3 + 3j,
-            "110000": -7 - 7j,
-            "110001": -7 - 5j,
-            "110010": -5 - 7j,
-            "110011": -5 - 5j,
-            "110100": -7 - 1j,
-            "110101": -7 - 3j,
-            "110110": -5 - 1j,
-            "110111": -5 - 3j,
-            "111000": -1 - 7j,
-            "111001": -1 - 5j,
-            "111010": -3 - 7j,
-            "111011": -3 - 5j,
-            "111100": -1 - 1j,
-            "111101": -1 - 3j,
-            "111110": -3 - 1j,
-            "111111": -3 - 3j,
-        }
+        lut = _QAM64_LUT
     try:
-        return np.array([qamMap[p] for p in pattern])
+        return _map_symbols(data, 6, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 64 QAM symbol.")
 
 
-def qam128_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default 128 QAM constellation, indexed by symbol value
+_QAM128_LUT = _symbol_lut(
+    {
+        "0000000": 1 + 1j,
+        "0000001": 1 + 3j,
+        "0000010": 1 + 5j,
+        "0000011": 1 + 7j,
+        "0000100": 1 + 9j,
+        "0000101": 1 + 11j,
+        "0000110": 1 - 11j,
+        "0000111": 1 - 9j,
+        "0001000": 1 - 7j,
+        "0001001": 1 - 5j,
+        "0001010": 1 - 3j,
+        "0001011": 1 - 1j,
+        "0001100": 3 + 1j,
+        "0001101": 3 + 3j,
+        "0001110": 3 + 5j,
+        "0001111": 3 + 7j,
+        "0010000": 3 + 9j,
+        "0010001": 3 + 11j,
+        "0010010": 3 - 11j,
+        "0010011": 3 - 9j,
+        "0010100": 3 - 7j,
+        "0010101": 3 - 5j,
+        "0010110": 3 - 3j,
+        "0010111": 3 - 1j,
+        "0011000": 5 + 1j,
+        "0011001": 5 + 3j,
+        "0011010": 5 + 5j,
+        "0011011": 5 + 7j,
+        "0011100": 5 + 9j,
+        "0011101": 5 + 11j,
+        "0011110": 5 - 11j,
+        "0011111": 5 - 9j,
+        "0100000": 5 - 7j,
+        "0100001": 5 - 5j,
+        "0100010": 5 - 3j,
+        "0100011": 5 - 1j,
+        "0100100": 7 + 1j,
+        "0100101": 7 + 3j,
+        "0100110": 7 + 5j,
+        "0100111": 7 + 7j,
+        "0101000": 7 + 9j,
+        "0101001": 7 + 11j,
+        "0101010": 7 - 11j,
+        "0101011": 7 - 9j,
+        "0101100": 7 - 7j,
+        "0101101": 7 - 5j,
+        "0101110": 7 - 3j,
+        "0101111": 7 - 1j,
+        "0110000": 9 + 1j,
+        "0110001": 9 + 3j,
+        "0110010": 9 + 5j,
+        "0110011": 9 + 7j,
+        "0110100": 9 - 7j,
+        "0110101": 9 - 5j,
+        "0110110": 9 - 3j,
+        "0110111": 9 - 1j,
+        "0111000": 1 + 1j,
+        "0111001": 1 + 3j,
+        "0111010": 1 + 5j,
+        "0111011": 1 + 7j,
+        "0111100": 1 - 7j,
+        "0111101": 1 - 5j,
+        "0111110": 1 - 3j,
+        "0111111": 1 - 1j,
+        "1000000": -1 + 1j,
+        "1000001": -1 + 3j,
+        "1000010": -1 + 5j,
+        "1000011": -1 + 7j,
+        "1000100": -1 - 7j,
+        "1000101": -1 - 5j,
+        "1000110": -1 - 3j,
+        "1000111": -1 - 1j,
+        "1001000": -9 + 1j,
+        "1001001": -9 + 3j,
+        "1001010": -9 + 5j,
+        "1001011": -9 + 7j,
+        "1001100": -9 - 7j,
+        "1001101": -9 - 5j,
+        "1001110": -9 - 3j,
+        "1001111": -9 - 1j,
+        "1010000": -7 + 1j,
+        "1010001": -7 + 3j,
+        "1010010": -7 + 5j,
+        "1010011": -7 + 7j,
+        "1010100": -7 + 9j,
+        "1010101": -7 + 11j,
+        "1010110": -7 - 11j,
+        "1010111": -7 - 9j,
+        "1011000": -7 - 7j,
+        "1011001": -7 - 5j,
+        "1011010": -7 - 3j,
+        "1011011": -7 - 1j,
+        "1011100": -5 + 1j,
+        "1011101": -5 + 3j,
+        "1011110": -5 + 5j,
+        "1011111": -5 + 7j,
+        "1100000": -5 + 9j,
+        "1100001": -5 + 11j,
+        "1100010": -5 - 11j,
+        "1100011": -5 - 9j,
+        "1100100": -5 - 7j,
+        "1100101": -5 - 5j,
+        "1100110": -5 - 3j,
+        "1100111": -5 - 1j,
+        "1101000": -3 + 1j,
+        "1101001": -3 + 3j,
+        "1101010": -3 + 5j,
+        "1101011": -3 + 7j,
+        "1101100": -3 + 9j,
+        "1101101": -3 + 11j,
+        "1101110": -3 - 11j,
+        "1101111": -3 - 9j,
+        "1110000": -3 - 7j,
+        "1110001": -3 - 5j,
+        "1110010": -3 - 3j,
+        "1110011": -3 - 1j,
+        "1110100": -1 + 1j,
+        "1110101": -1 + 3j,
+        "1110110": -1 + 5j,
+        "1110111": -1 + 7j,
+        "1111000": -1 + 9j,
+        "1111001": -1 + 11j,
+        "1111010": -1 - 11j,
+        "1111011": -1 - 9j,
+        "1111100": -1 - 7j,
+        "1111101": -1 - 5j,
+        "1111110": -1 - 3j,
+        "1111111": -1 - 1j,
+    },
+    7,
+)
+
+
+def qam128_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for 128 QAM.
 
@@ -1363,161 +1912,30 @@ def qam128_modulator(data, customMap=None):
     customMap is a dict whos keys are strings containing the symbol's
     binary value and whos values are the symbol's location in the
     complex plane.
-    e.g. customMap = {'0101': 0.707 + 0.707j, ...}"""
-
-    pattern = [
-        str(d0) + str(d1) + str(d2) + str(d3) + str(d4) + str(d5) + str(d6)
-        for d0, d1, d2, d3, d4, d5, d6 in zip(
-            data[0::7],
-            data[1::7],
-            data[2::7],
-            data[3::7],
-            data[4::7],
-            data[5::7],
-            data[6::7],
-        )
-    ]
+    e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively."""
+
     if customMap:
-        qamMap = customMap
+        lut = _symbol_lut(customMap, 7)
     else:
-        qamMap = {
-            "0000000": 1 + 1j,
-            "0000001": 1 + 3j,
-            "0000010": 1 + 5j,
-            "0000011": 1 + 7j,
-            "0000100": 1 + 9j,
-            "0000101": 1 + 11j,
-            "0000110": 1 - 11j,
-            "0000111": 1 - 9j,
-            "0001000": 1 - 7j,
-            "0001001": 1 - 5j,
-            "0001010": 1 - 3j,
-            "0001011": 1 - 1j,
-            "0001100": 3 + 1j,
-            "0001101": 3 + 3j,
-            "0001110": 3 + 5j,
-            "0001111": 3 + 7j,
-            "0010000": 3 + 9j,
-            "0010001": 3 + 11j,
-            "0010010": 3 - 11j,
-            "0010011": 3 - 9j,
-            "0010100": 3 - 7j,
-            "0010101": 3 - 5j,
-            "0010110": 3 - 3j,
-            "0010111": 3 - 1j,
-            "0011000": 5 + 1j,
-            "0011001": 5 + 3j,
-            "0011010": 5 + 5j,
-            "0011011": 5 + 7j,
-            "0011100": 5 + 9j,
-            "0011101": 5 + 11j,
-            "0011110": 5 - 11j,
-            "0011111": 5 - 9j,
-            "0100000": 5 - 7j,
-            "0100001": 5 - 5j,
-            "0100010": 5 - 3j,
-            "0100011": 5 - 1j,
-            "0100100": 7 + 1j,
-            "0100101": 7 + 3j,
-            "0100110": 7 + 5j,
-            "0100111": 7 + 7j,
-            "0101000": 7 + 9j,
-            "0101001": 7 + 11j,
-            "0101010": 7 - 11j,
-            "0101011": 7 - 9j,
-            "0101100": 7 - 7j,
-            "0101101": 7 - 5j,
-            "0101110": 7 - 3j,
-            "0101111": 7 - 1j,
-            "0110000": 9 + 1j,
-            "0110001": 9 + 3j,
-            "0110010": 9 + 5j,
-            "0110011": 9 + 7j,
-            "0110100": 9 - 7j,
-            "0110101": 9 - 5j,
-            "0110110": 9 - 3j,
-            "0110111": 9 - 1j,
-            "0111000": 1 + 1j,
-            "0111001": 1 + 3j,
-            "0111010": 1 + 5j,
-            "0111011": 1 + 7j,
-            "0111100": 1 - 7j,
-            "0111101": 1 - 5j,
-            "0111110": 1 - 3j,
-            "0111111": 1 - 1j,
-            "1000000": -1 + 1j,
-            "1000001": -1 + 3j,
-            "1000010": -1 + 5j,
-            "1000011": -1 + 7j,
-            "1000100": -1 - 7j,
-            "1000101": -1 - 5j,
-            "1000110": -1 - 3j,
-            "1000111": -1 - 1j,
-            "1001000": -9 + 1j,
-            "1001001": -9 + 3j,
-            "1001010": -9 + 5j,
-            "1001011": -9 + 7j,
-            "1001100": -9 - 7j,
-            "1001101": -9 - 5j,
-            "1001110": -9 - 3j,
-            "1001111": -9 - 1j,
-            "1010000": -7 + 1j,
-            "1010001": -7 + 3j,
-            "1010010": -7 + 5j,
-            "1010011": -7 + 7j,
-            "1010100": -7 + 9j,
-            "1010101": -7 + 11j,
-            "1010110": -7 - 11j,
-            "1010111": -7 - 9j,
-            "1011000": -7 - 7j,
-            "1011001": -7 - 5j,
-            "1011010": -7 - 3j,
-            "1011011": -7 - 1j,
-            "1011100": -5 + 1j,
-            "1011101": -5 + 3j,
-            "1011110": -5 + 5j,
-            "1011111": -5 + 7j,
-            "1100000": -5 + 9j,
-            "1100001": -5 + 11j,
-            "1100010": -5 - 11j,
-            "1100011": -5 - 9j,
-            "1100100": -5 - 7j,
-            "1100101": -5 - 5j,
-            "1100110": -5 - 3j,
-            "1100111": -5 - 1j,
-            "1101000": -3 + 1j,
-            "1101001": -3 + 3j,
-            "1101010": -3 + 5j,
-            "1101011": -3 + 7j,
-            "1101100": -3 + 9j,
-            "1101101": -3 + 11j,
-            "1101110": -3 - 11j,
-            "1101111": -3 - 9j,
-            "1110000": -3 - 7j,
-            "1110001": -3 - 5j,
-            "1110010": -3 - 3j,
-            "1110011": -3 - 1j,
-            "1110100": -1 + 1j,
-            "1110101": -1 + 3j,
-            "1110110": -1 + 5j,
-            "1110111": -1 + 7j,
-            "1111000": -1 + 9j,
-            "1111001": -1 + 11j,
-            "1111010": -1 - 11j,
-            "1111011": -1 - 9j,
-            "1111100": -1 - 7j,
-            "1111101": -1 - 5j,
-            "1111110": -1 - 3j,
-            "1111111": -1 - 1j,
-        }
+        lut = _QAM128_LUT
     try:
-        return np.array([qamMap[p] for p in pattern])
+        return _map_symbols(data, 7, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 128 QAM symbol.")
 
 
-def qam256_modulator(data, customMap=None):
-    """Converts list of bits to symbol values as strings, maps each
+# Default 256 QAM constellation, indexed by symbol value
+# The constellation is separable: the upper four bits of a symbol select the I level and the lower four bits select
+# the Q level. Read as a 4-bit two's complement number s, each nibble maps to the normalized level (2 * s + 1) / 15.
+_QAM256_LEVELS = (2 * ((np.arange(16) + 8) % 16 - 8) + 1) / 15
+_QAM256_LUT = np.add.outer(_QAM256_LEVELS, 1j * _QAM256_LEVELS).ravel()
+
+
+def qam256_modulator(data, customMap=None, dtype=np.float64):
+    """Converts list of bits to integer symbol values, maps each
     symbol value to a position on the complex plane, and returns an
     array of complex values for 256 QAM.
 
@@ -1528,289 +1946,39 @@ def qam256_modulator(data, customMap=None):
     customMap is a dict whos keys are strings containing the symbol's
     binary value and whos values are the symbol's location in the
     complex plane.
-    e.g. customMap = {'0101': 0.707 + 0.707j, ...}"""
-
-    pattern = [
-        str(d0) + str(d1) + str(d2) + str(d3) + str(d4) + str(d5) + str(d6) + str(d7)
-        for d0, d1, d2, d3, d4, d5, d6, d7 in zip(
-            data[0::8],
-            data[1::8],
-            data[2::8],
-            data[3::8],
-            data[4::8],
-            data[5::8],
-            data[6::8],
-            data[7::8],
-        )
-    ]
+    e.g. customMap = {'0101': 0.707 + 0.707j, ...}
+
+    dtype is the floating point precision of the returned symbols
+    (np.float64 or np.float32), complex128 or complex64 respectively."""
+
     if customMap:
-        qamMap = customMap
+        lut = _symbol_lut(customMap, 8)
     else:
-        qamMap = {
-            "00000000": +0.06666666667 + 0.06666666667j,
-            "00000001": +0.06666666667 + 0.20000000000j,
-            "00000010": +0.06666666667 + 0.33333333333j,
-            "00000011": +0.06666666667 + 0.46666666667j,
-            "00000100": +0.06666666667 + 0.60000000000j,
-            "00000101": +0.06666666667 + 0.73333333333j,
-            "00000110": +0.06666666667 + 0.86666666667j,
-            "00000111": +0.06666666667 + 1.00000000000j,
-            "00001000": +0.06666666667 - 1.00000000000j,
-            "00001001": +0.06666666667 - 0.86666666667j,
-            "00001010": +0.06666666667 - 0.73333333333j,
-            "00001011": +0.06666666667 - 0.60000000000j,
-            "00001100": +0.06666666667 - 0.46666666667j,
-            "00001101": +0.06666666667 - 0.33333333333j,
-            "00001110": +0.06666666667 - 0.20000000000j,
-            "00001111": +0.06666666667 - 0.06666666667j,
-            "00010000": +0.20000000000 + 0.06666666667j,
-            "00010001": +0.20000000000 + 0.20000000000j,
-            "00010010": +0.20000000000 + 0.33333333333j,
-            "00010011": +0.20000000000 + 0.46666666667j,
-            "00010100": +0.20000000000 + 0.60000000000j,
-            "00010101": +0.20000000000 + 0.73333333333j,
-            "00010110": +0.20000000000 + 0.86666666667j,
-            "00010111": +0.20000000000 + 1.00000000000j,
-            "00011000": +0.20000000000 - 1.00000000000j,
-            "00011001": +0.20000000000 - 0.86666666667j,
-            "00011010": +0.20000000000 - 0.73333333333j,
-            "00011011": +0.20000000000 - 0.60000000000j,
-            "00011100": +0.20000000000 - 0.46666666667j,
-            "00011101": +0.20000000000 - 0.33333333333j,
-            "00011110": +0.20000000000 - 0.20000000000j,
-            "00011111": +0.20000000000 - 0.06666666667j,
-            "00100000": +0.33333333333 + 0.06666666667j,
-            "00100001": +0.33333333333 + 0.20000000000j,
-            "00100010": +0.33333333333 + 0.33333333333j,
-            "00100011": +0.33333333333 + 0.46666666667j,
-            "00100100": +0.33333333333 + 0.60000000000j,
-            "00100101": +0.33333333333 + 0.73333333333j,
-            "00100110": +0.33333333333 + 0.86666666667j,
-            "00100111": +0.33333333333 + 1.00000000000j,
-            "00101000": +0.33333333333 - 1.00000000000j,
-            "00101001": +0.33333333333 - 0.86666666667j,
-            "00101010": +0.33333333333 - 0.73333333333j,
-            "00101011": +0.33333333333 - 0.60000000000j,
-            "00101100": +0.33333333333 - 0.46666666667j,
-            "00101101": +0.33333333333 - 0.33333333333j,
-            "00101110": +0.33333333333 - 0.20000000000j,
-            "00101111": +0.33333333333 - 0.06666666667j,
-            "00110000": +0.46666666667 + 0.06666666667j,
-            "00110001": +0.46666666667 + 0.20000000000j,
-            "00110010": +0.46666666667 + 0.33333333333j,
-            "00110011": +0.46666666667 + 0.46666666667j,
-            "00110100": +0.46666666667 + 0.60000000000j,
-            "00110101": +0.46666666667 + 0.73333333333j,
-            "00110110": +0.46666666667 + 0.86666666667j,
-            "00110111": +0.46666666667 + 1.00000000000j,
-            "00111000": +0.46666666667 - 1.00000000000j,
-            "00111001": +0.46666666667 - 0.86666666667j,
-            "00111010": +0.46666666667 - 0.73333333333j,
-            "00111011": +0.46666666667 - 0.60000000000j,
-            "00111100": +0.46666666667 - 0.46666666667j,
-            "00111101": +0.46666666667 - 0.33333333333j,
-            "00111110": +0.46666666667 - 0.20000000000j,
-            "00111111": +0.46666666667 - 0.06666666667j,
-            "01000000": +0.60000000000 + 0.06666666667j,
-            "01000001": +0.60000000000 + 0.20000000000j,
-            "01000010": +0.60000000000 + 0.33333333333j,
-            "01000011": +0.60000000000 + 0.46666666667j,
-            "01000100": +0.60000000000 + 0.60000000000j,
-            "01000101": +0.60000000000 + 0.73333333333j,
-            "01000110": +0.60000000000 + 0.86666666667j,
-            "01000111": +0.60000000000 + 1.00000000000j,
-            "01001000": +0.60000000000 - 1.00000000000j,
-            "01001001": +0.60000000000 - 0.86666666667j,
-            "01001010": +0.60000000000 - 0.73333333333j,
-            "01001011": +0.60000000000 - 0.60000000000j,
-            "01001100": +0.60000000000 - 0.46666666667j,
-            "01001101": +0.60000000000 - 0.33333333333j,
-            "01001110": +0.60000000000 - 0.20000000000j,
-            "01001111": +0.60000000000 - 0.06666666667j,
-            "01010000": +0.73333333333 + 0.06666666667j,
-            "01010001": +0.73333333333 + 0.20000000000j,
-            "01010010": +0.73333333333 + 0.33333333333j,
-            "01010011": +0.73333333333 + 0.46666666667j,
-            "01010100": +0.73333333333 + 0.60000000000j,
-            "01010101": +0.73333333333 + 0.73333333333j,
-            "01010110": +0.73333333333 + 0.86666666667j,
-            "01010111": +0.73333333333 + 1.00000000000j,
-            "01011000": +0.73333333333 - 1.00000000000j,
-            "01011001": +0.73333333333 - 0.86666666667j,
-            "01011010": +0.73333333333 - 0.73333333333j,
-            "01011011": +0.73333333333 - 0.60000000000j,
-            "01011100": +0.73333333333 - 0.46666666667j,
-            "01011101": +0.73333333333 - 0.33333333333j,
-            "01011110": +0.73333333333 - 0.20000000000j,
-            "01011111": +0.73333333333 - 0.06666666667j,
-            "01100000": +0.86666666667 + 0.06666666667j,
-            "01100001": +0.86666666667 + 0.20000000000j,
-            "01100010": +0.86666666667 + 0.33333333333j,
-            "01100011": +0.86666666667 + 0.46666666667j,
-            "01100100": +0.86666666667 + 0.60000000000j,
-            "01100101": +0.86666666667 + 0.73333333333j,
-            "01100110": +0.86666666667 + 0.86666666667j,
-            "01100111": +0.86666666667 + 1.00000000000j,
-            "01101000": +0.86666666667 - 1.00000000000j,
-            "01101001": +0.86666666667 - 0.86666666667j,
-            "01101010": +0.86666666667 - 0.73333333333j,
-            "01101011": +0.86666666667 - 0.60000000000j,
-            "01101100": +0.86666666667 - 0.46666666667j,
-            "01101101": +0.86666666667 - 0.33333333333j,
-            "01101110": +0.86666666667 - 0.20000000000j,
-            "01101111": +0.86666666667 - 0.06666666667j,
-            "01110000": +1.00000000000 + 0.06666666667j,
-            "01110001": +1.00000000000 + 0.20000000000j,
-            "01110010": +1.00000000000 + 0.33333333333j,
-            "01110011": +1.00000000000 + 0.46666666667j,
-            "01110100": +1.00000000000 + 0.60000000000j,
-            "01110101": +1.00000000000 + 0.73333333333j,
-            "01110110": +1.00000000000 + 0.86666666667j,
-            "01110111": +1.00000000000 + 1.00000000000j,
-            "01111000": +1.00000000000 - 1.00000000000j,
-            "01111001": +1.00000000000 - 0.86666666667j,
-            "01111010": +1.00000000000 - 0.73333333333j,
-            "01111011": +1.00000000000 - 0.60000000000j,
-            "01111100": +1.00000000000 - 0.46666666667j,
-            "01111101": +1.00000000000 - 0.33333333333j,
-            "01111110": +1.00000000000 - 0.20000000000j,
-            "01111111": +1.00000000000 - 0.06666666667j,
-            "10000000": -1.00000000000 + 0.06666666667j,
-            "10000001": -1.00000000000 + 0.20000000000j,
-            "10000010": -1.00000000000 + 0.33333333333j,
-            "10000011": -1.00000000000 + 0.46666666667j,
-            "10000100": -1.00000000000 + 0.60000000000j,
-            "10000101": -1.00000000000 + 0.73333333333j,
-            "10000110": -1.00000000000 + 0.86666666667j,
-            "10000111": -1.00000000000 + 1.00000000000j,
-            "10001000": -1.00000000000 - 1.00000000000j,
-            "10001001": -1.00000000000 - 0.86666666667j,
-            "10001010": -1.00000000000 - 0.73333333333j,
-            "10001011": -1.00000000000 - 0.60000000000j,
-            "10001100": -1.00000000000 - 0.46666666667j,
-            "10001101": -1.00000000000 - 0.33333333333j,
-            "10001110": -1.00000000000 - 0.20000000000j,
-            "10001111": -1.00000000000 - 0.06666666667j,
-            "10010000": -0.86666666667 + 0.06666666667j,
-            "10010001": -0.86666666667 + 0.20000000000j,
-            "10010010": -0.86666666667 + 0.33333333333j,
-            "10010011": -0.86666666667 + 0.46666666667j,
-            "10010100": -0.86666666667 + 0.60000000000j,
-            "10010101": -0.86666666667 + 0.73333333333j,
-            "10010110": -0.86666666667 + 0.86666666667j,
-            "10010111": -0.86666666667 + 1.00000000000j,
-            "10011000": -0.86666666667 - 1.00000000000j,
-            "10011001": -0.86666666667 - 0.86666666667j,
-            "10011010": -0.86666666667 - 0.73333333333j,
-            "10011011": -0.86666666667 - 0.60000000000j,
-            "10011100": -0.86666666667 - 0.46666666667j,
-            "10011101": -0.86666666667 - 0.33333333333j,
-            "10011110": -0.86666666667 - 0.20000000000j,
-            "10011111": -0.86666666667 - 0.06666666667j,
-            "10100000": -0.73333333333 + 0.06666666667j,
-            "10100001": -0.73333333333 + 0.20000000000j,
-            "10100010": -0.73333333333 + 0.33333333333j,
-            "10100011": -0.73333333333 + 0.46666666667j,
-            "10100100": -0.73333333333 + 0.60000000000j,
-            "10100101": -0.73333333333 + 0.73333333333j,
-            "10100110": -0.73333333333 + 0.86666666667j,
-            "10100111": -0.73333333333 + 1.00000000000j,
-            "10101000": -0.73333333333 - 1.00000000000j,
-            "10101001": -0.73333333333 - 0.86666666667j,
-            "10101010": -0.73333333333 - 0.73333333333j,
-            "10101011": -0.73333333333 - 0.60000000000j,
-            "10101100": -0.73333333333 - 0.46666666667j,
-            "10101101": -0.73333333333 - 0.33333333333j,
-            "10101110": -0.73333333333 - 0.20000000000j,
-            "10101111": -0.73333333333 - 0.06666666667j,
-            "10110000": -0.60000000000 + 0.06666666667j,
-            "10110001": -0.60000000000 + 0.20000000000j,
-            "10110010": -0.60000000000 + 0.33333333333j,
-            "10110011": -0.60000000000 + 0.46666666667j,
-            "10110100": -0.60000000000 + 0.60000000000j,
-            "10110101": -0.60000000000 + 0.73333333333j,
-            "10110110": -0.60000000000 + 0.86666666667j,
-            "10110111": -0.60000000000 + 1.00000000000j,
-            "10111000": -0.60000000000 - 1.00000000000j,
-            "10111001": -0.60000000000 - 0.86666666667j,
-            "10111010": -0.60000000000 - 0.73333333333j,
-            "10111011": -0.60000000000 - 0.60000000000j,
-            "10111100": -0.60000000000 - 0.46666666667j,
-            "10111101": -0.60000000000 - 0.33333333333j,
-            "10111110": -0.60000000000 - 0.20000000000j,
-            "10111111": -0.60000000000 - 0.06666666667j,
-            "11000000": -0.46666666667 + 0.06666666667j,
-            "11000001": -0.46666666667 + 0.20000000000j,
-            "11000010": -0.46666666667 + 0.33333333333j,
-            "11000011": -0.46666666667 + 0.46666666667j,
-            "11000100": -0.46666666667 + 0.60000000000j,
-            "11000101": -0.46666666667 + 0.73333333333j,
-            "11000110": -0.46666666667 + 0.86666666667j,
-            "11000111": -0.46666666667 + 1.00000000000j,
-            "11001000": -0.46666666667 - 1.00000000000j,
-            "11001001": -0.46666666667 - 0.86666666667j,
-            "11001010": -0.46666666667 - 0.73333333333j,
-            "11001011": -0.46666666667 - 0.60000000000j,
-            "11001100": -0.46666666667 - 0.46666666667j,
-            "11001101": -0.46666666667 - 0.33333333333j,
-            "11001110": -0.46666666667 - 0.20000000000j,
-            "11001111": -0.46666666667 - 0.06666666667j,
-            "11010000": -0.33333333333 + 0.06666666667j,
-            "11010001": -0.33333333333 + 0.20000000000j,
-            "11010010": -0.33333333333 + 0.33333333333j,
-            "11010011": -0.33333333333 + 0.46666666667j,
-            "11010100": -0.33333333333 + 0.60000000000j,
-            "11010101": -0.33333333333 + 0.73333333333j,
-            "11010110": -0.33333333333 + 0.86666666667j,
-            "11010111": -0.33333333333 + 1.00000000000j,
-            "11011000": -0.33333333333 - 1.00000000000j,
-            "11011001": -0.33333333333 - 0.86666666667j,
-            "11011010": -0.33333333333 - 0.73333333333j,
-            "11011011": -0.33333333333 - 0.60000000000j,
-            "11011100": -0.33333333333 - 0.46666666667j,
-            "11011101": -0.33333333333 - 0.33333333333j,
-            "11011110": -0.33333333333 - 0.20000000000j,
-            "11011111": -0.33333333333 - 0.06666666667j,
-            "11100000": -0.20000000000 + 0.06666666667j,
-            "11100001": -0.20000000000 + 0.20000000000j,
-            "11100010": -0.20000000000 + 0.33333333333j,
-            "11100011": -0.20000000000 + 0.46666666667j,
-            "11100100": -0.20000000000 + 0.60000000000j,
-            "11100101": -0.20000000000 + 0.73333333333j,
-            "11100110": -0.20000000000 + 0.86666666667j,
-            "11100111": -0.20000000000 + 1.00000000000j,
-            "11101000": -0.20000000000 - 1.00000000000j,
-            "11101001": -0.20000000000 - 0.86666666667j,
-            "11101010": -0.20000000000 - 0.73333333333j,
-            "11101011": -0.20000000000 - 0.60000000000j,
-            "11101100": -0.20000000000 - 0.46666666667j,
-            "11101101": -0.20000000000 - 0.33333333333j,
-            "11101110": -0.20000000000 - 0.20000000000j,
-            "11101111": -0.20000000000 - 0.06666666667j,
-            "11110000": -0.06666666667 + 0.06666666667j,
-            "11110001": -0.06666666667 + 0.20000000000j,
-            "11110010": -0.06666666667 + 0.33333333333j,
-            "11110011": -0.06666666667 + 0.46666666667j,
-            "11110100": -0.06666666667 + 0.60000000000j,
-            "11110101": -0.06666666667 + 0.73333333333j,
-            "11110110": -0.06666666667 + 0.86666666667j,
-            "11110111": -0.06666666667 + 1.00000000000j,
-            "11111000": -0.06666666667 - 1.00000000000j,
-            "11111001": -0.06666666667 - 0.86666666667j,
-            "11111010": -0.06666666667 - 0.73333333333j,
-            "11111011": -0.06666666667 - 0.60000000000j,
-            "11111100": -0.06666666667 - 0.46666666667j,
-            "11111101": -0.06666666667 - 0.33333333333j,
-            "11111110": -0.06666666667 - 0.20000000000j,
-            "11111111": -0.06666666667 - 0.06666666667j,
-        }
+        lut = _QAM256_LUT
 
     try:
-        return np.array([qamMap[p] for p in pattern])
+        return _map_symbols(data, 8, lut, dtype)
     except KeyError:
         raise ValueError("Invalid 256 QAM symbol.")
 
 
+# Bits per symbol and modulator function for each digmod_generator modType
+_MODULATORS = {
+    "bpsk": (1, bpsk_modulator),
+    "qpsk": (2, qpsk_modulator),
+    "psk8": (3, psk8_modulator),
+    "psk16": (4, psk16_modulator),
+    "apsk16": (4, apsk16_modulator),
+    "apsk32": (5, apsk32_modulator),
+    "apsk64": (6, apsk64_modulator),
+    "qam16": (4, qam16_modulator),
+    "qam32": (5, qam32_modulator),
+    "qam64": (6, qam64_modulator),
+    "qam128": (7, qam128_modulator),
+    "qam256": (8, qam256_modulator),
+}
+
+
 def digmod_prbs_generator(
     fs=100e6,
     modType="qpsk",
@@ -1856,6 +2024,8 @@ def digmod_generator(
     wfmFormat="iq",
     zeroLast=False,
     plot=False,
+    seed=None,
+    dtype=np.float64,
 ):
     """
     Generates a digitally modulated signal at baseband with a given modulation type, number of symbols, and filter type/alpha
@@ -1874,6 +2044,8 @@ def digmod_generator(
         wfmFormat (str): Determines type of waveform. Currently only 'iq' format is supported.
         zeroLast (bool): Force the last sample point to 0.
         plot (bool): Enable or disable plotting of final waveform in time domain and constellation domain.
+        seed (int): Seed for the random data. The default of None draws fresh data every call.
+        dtype (NumPy dtype): Floating point precision used to create the waveform (np.float64 or np.float32).
 
     Returns:
         (NumPy array): Array containing the complex values of the waveform.
@@ -1910,71 +2082,32 @@ def digmod_generator(
     # print(f'Oversampling factor: {finalOsNum} / {finalOsDenom}')
     if finalOsNum > 200 and finalOsDenom > 200:
         print(f"Oversampling factor: {finalOsNum} / {finalOsDenom}")
-        warn(
+        warnings.warn(
             f"Poor choice of sample rate/symbol rate. Resulting waveform will be large and slightly distorted. Choose sample rate so that it is an integer multiple of symbol rate."
         )
 
     # If necessary, adjust the number of symbols to ensure an integer number of samples after final resampling
-    numSamples = numSymbols * finalOsNum / finalOsDenom
+    # fracOs is in lowest terms, so that only requires a multiple of finalOsDenom symbols. Round up to the nearest one
+    # rather than taking the least common multiple, which can multiply the waveform length by up to finalOsDenom.
     # print(f'Initial numSymbols: {numSymbols}')
-    if not numSamples.is_integer():
-        numSymbols = np.lcm(numSymbols, finalOsDenom)
+    if numSymbols % finalOsDenom:
+        numSymbols += finalOsDenom - numSymbols % finalOsDenom
         # print(f'Adjusted numSymbols: {numSymbols}')
 
     # Define bits per symbol and modulator function based on modType
-    if modType.lower() == "bpsk":
-        bitsPerSym = 1
-        modulator = bpsk_modulator
-    elif modType.lower() == "qpsk":
-        bitsPerSym = 2
-        modulator = qpsk_modulator
-    elif modType.lower() == "psk8":
-        bitsPerSym = 3
-        modulator = psk8_modulator
-    elif modType.lower() == "psk16":
-        bitsPerSym = 4
-        modulator = psk16_modulator
-    elif modType.lower() == "apsk16":
-        bitsPerSym = 4
-        modulator = apsk16_modulator
-    elif modType.lower() == "apsk32":
-        bitsPerSym = 5
-        modulator = apsk32_modulator
-    elif modType.lower() == "apsk64":
-        bitsPerSym = 6
-        modulator = apsk64_modulator
-    elif modType.lower() == "qam16":
-        bitsPerSym = 4
-        modulator = qam16_modulator
-    elif modType.lower() == "qam32":
-        bitsPerSym = 5
-        modulator = qam32_modulator
-    elif modType.lower() == "qam64":
-        bitsPerSym = 6
-        modulator = qam64_modulator
-    elif modType.lower() == "qam128":
-        bitsPerSym = 7
-        modulator = qam128_modulator
-    elif modType.lower() == "qam256":
-        bitsPerSym = 8
-        modulator = qam256_modulator
-    else:
+    try:
+        bitsPerSym, modulator = _MODULATORS[modType.lower()]
+    except KeyError:
         raise ValueError("Invalid modType chosen.")
 
-    # Create random bit pattern
-    bits = np.random.randint(0, 2, bitsPerSym * numSymbols)
-    # tempBits = bits
-    # repeats = 1
-    # while len(bits) % bitsPerSym:
-    #     bits = np.tile(tempBits, repeats)
-    #     repeats += 1
+    # Create random bit pattern, which is always an integer number of symbols long so no padding is needed
+    # Drawing random bytes and unpacking them into bits is much faster than drawing one bit at a time
+    numBits = bitsPerSym * numSymbols
+    rng = np.random.default_rng(seed)
+    bits = np.unpackbits(rng.integers(0, 256, -(-numBits // 8), dtype=np.uint8), count=numBits)
 
     # Group the bits into symbol values and then map the symbols to locations in the complex plane.
-    modulatedValues = modulator(bits)
-
-    # Zero-pad symbols to satisfy oversampling factor and provide impulse-like response for better pulse shaping performance.
-    rawSymbols = np.zeros(len(modulatedValues) * intermediateOsFactor, dtype=complex)
-    rawSymbols[::intermediateOsFactor] = modulatedValues
+    modulatedValues = modulator(bits, dtype=dtype)
 
     # Create pulse shaping filter
     # The number of taps required must be a multiple of the oversampling factor
@@ -1987,57 +2120,117 @@ def digmod_generator(
     else:
         raise error.WfmBuilderError("Invalid pulse shaping filter chosen. Use 'raisedcosine' or 'rootraisedcosine'")
 
-    """There are several considerations here."""
-    # At the beginning and the end of convolution, the two arrays don't
-    # fully overlap, which results in invalid data. We don't want to
-    # keep that data, so we're prepending the end of the signal onto
-    # the beginning and append the beginning onto the end to provide
-    # "runway" for the convolution. We will be throwing this prepended
-    # and appended data away at the end of the signal creation process.
-    #
-    # In order to eliminate wraparound issues, we need to ensure that
-    # the prepended and appended segments will be an integer number of
-    # samples AFTER final resampling. The extra segments must also
-    # be at least as long as the pulse shaping filter so that we have
-    # enough runway to get all the invalid samples out before getting
-    # into the meat of the waveform.
-
-    # Determine wraparound location
-    wrapLocation = finalOsDenom
-    # Make sure it's at least as long as the pulse shaping filter
-    while wrapLocation < taps:
-        wrapLocation *= 2
-
-    # Prepend and append
-    rawSymbols = np.concatenate([rawSymbols[-wrapLocation:], rawSymbols, rawSymbols[:wrapLocation]])
-
-    # Apply pulse shaping filter to symbols via convolution
-    filteredSymbols = np.convolve(rawSymbols, psFilter, mode="same")
-
-    # Perform the final resampling AND filter out images using a single SciPy function
-    iq = sig.resample_poly(filteredSymbols, finalOsNum, finalOsDenom, window=("kaiser", 11))
-
-    # Calculate location of final prepended and appended segments
-    finalWrapLocation = wrapLocation * finalOsNum / finalOsDenom
-    if finalWrapLocation.is_integer():
-        finalWrapLocation = int(finalWrapLocation)
+    # The pulse shaping filter runs at intermediateOsFactor samples per symbol and the final resampling filter runs
+    # at finalOsNum times that rate. Both are linear, so the shaping filter can be upsampled to the resampling rate
+    # and folded into the same lowpass filter resample_poly would design, taking the symbols straight to the final
+    # sample rate in one pass. Only every gcd(up, finalOsDenom)-th phase of the interpolated signal survives the
+    # decimation, and when decimation discards most of the computed samples, filtering in two stages is cheaper.
+    up = intermediateOsFactor * finalOsNum
+    phaseStep = int(np.gcd(up, finalOsDenom))
+
+    if finalOsDenom // phaseStep * finalOsNum <= max(finalOsNum, finalOsDenom):
+        if finalOsNum == finalOsDenom == 1:
+            halfLen = 0
+            resampleFilter = np.ones(1)
+        else:
+            maxRate = max(finalOsNum, finalOsDenom)
+            halfLen = 10 * maxRate
+            resampleFilter = sig.firwin(2 * halfLen + 1, 1 / maxRate, window=("kaiser", 11)) * finalOsNum
+        shapingFilter = np.zeros(len(psFilter) * finalOsNum)
+        shapingFilter[::finalOsNum] = psFilter
+        combinedFilter = np.convolve(shapingFilter, resampleFilter)
+
+        # Prepend the end of the signal and append the beginning to provide "runway" for the convolution. Covering the
+        # full length of the combined filter keeps every startup transient out of the waveform, so it wraps seamlessly.
+        wrapSymbols = int(np.ceil(len(combinedFilter) / up)) + 1
+        paddedSymbols = np.take(
+            modulatedValues, np.arange(-wrapSymbols, len(modulatedValues) + wrapSymbols), mode="wrap"
+        )
+
+        # Split the combined filter into one branch per surviving output phase, convolve each branch with the
+        # symbols at the symbol rate, and interleave the branch outputs
+        polyFilter = np.zeros(int(np.ceil(len(combinedFilter) / up)) * up, dtype=dtype)
+        polyFilter[: len(combinedFilter)] = combinedFilter
+        delay = (wrapSymbols * intermediateOsFactor + (len(psFilter) - 1) // 2) * finalOsNum + halfLen
+        polyFilter = polyFilter.reshape(-1, up).T[delay % phaseStep :: phaseStep]
+        # The filter bank is a batch of independent FFTs, so let scipy.fft spread them across all cores
+        with scipy.fft.set_workers(-1):
+            iq = sig.oaconvolve(paddedSymbols[np.newaxis, :], polyFilter, axes=1).T.ravel()
+
+        # Decimate, starting from the first waveform sample after compensating for the delay of both filters
+        iq = np.ascontiguousarray(
+            iq[delay // phaseStep :: finalOsDenom // phaseStep][: len(modulatedValues) * up // finalOsDenom]
+        )
     else:
-        raise error.WfmBuilderError(
-            "Signal does not meet conditions for wraparound mitigation, choose sample rate so that it is an integer multiple of symbol rate."
+        """There are several considerations here."""
+        # At the beginning and the end of convolution, the two arrays don't
+        # fully overlap, which results in invalid data. We don't want to
+        # keep that data, so we're prepending the end of the signal onto
+        # the beginning and append the beginning onto the end to provide
+        # "runway" for the convolution. We will be throwing this prepended
+        # and appended data away at the end of the signal creation process.
+        #
+        # In order to eliminate wraparound issues, we need to ensure that
+        # the prepended and appended segments will be an integer number of
+        # samples AFTER final resampling. The extra segments must also
+        # be at least as long as the pulse shaping filter so that we have
+        # enough runway to get all the invalid samples out before getting
+        # into the meat of the waveform.
+
+        # Determine wraparound location
+        wrapLocation = finalOsDenom
+        # Make sure it's at least as long as the pulse shaping filter
+        while wrapLocation < taps:
+            wrapLocation *= 2
+
+        # Prepend and append in the symbol domain. The runway must cover wrapLocation samples plus the full
+        # length of the pulse shaping filter so none of the convolution's startup transient lands in the kept samples.
+        wrapSymbols = int(np.ceil((wrapLocation + len(psFilter)) / intermediateOsFactor))
+        paddedSymbols = np.take(
+            modulatedValues, np.arange(-wrapSymbols, len(modulatedValues) + wrapSymbols), mode="wrap"
         )
 
-    # Trim off prepended and appended segments
-    iq = iq[finalWrapLocation:-finalWrapLocation]
+        # Upsample and pulse shape with a polyphase FFT convolution. Zero-stuffing the symbols and convolving with the
+        # whole filter wastes most of the work on the stuffed zeros, so instead split the filter into one branch per
+        # output phase, convolve each branch with the symbols at the symbol rate, and interleave the branch outputs.
+        polyFilter = np.zeros(int(np.ceil(len(psFilter) / intermediateOsFactor)) * intermediateOsFactor, dtype=dtype)
+        polyFilter[: len(psFilter)] = psFilter
+        polyFilter = polyFilter.reshape(-1, intermediateOsFactor).T
+        with scipy.fft.set_workers(-1):
+            filteredSymbols = sig.oaconvolve(paddedSymbols[np.newaxis, :], polyFilter, axes=1).T.ravel()
+
+        # Keep wrapLocation samples of runway on either side of the waveform, compensating for the filter delay
+        start = wrapSymbols * intermediateOsFactor - wrapLocation + (len(psFilter) - 1) // 2
+        filteredSymbols = filteredSymbols[
+            start : start + len(modulatedValues) * intermediateOsFactor + 2 * wrapLocation
+        ]
+
+        # Perform the final resampling AND filter out images using a single SciPy function
+        iq = sig.resample_poly(filteredSymbols, finalOsNum, finalOsDenom, window=("kaiser", 11))
+
+        # Calculate location of final prepended and appended segments
+        finalWrapLocation = wrapLocation * finalOsNum / finalOsDenom
+        if finalWrapLocation.is_integer():
+            finalWrapLocation = int(finalWrapLocation)
+        else:
+            raise error.WfmBuilderError(
+                "Signal does not meet conditions for wraparound mitigation, choose sample rate so that it is an integer multiple of symbol rate."
+            )
+
+        # Trim off prepended and appended segments
+        iq = iq[finalWrapLocation:-finalWrapLocation]
 
     # Scale signal to prevent compressing iq modulator
-    sFactor = abs(np.amax(iq))
-    iq = iq / sFactor * 0.707
+    sFactor = np.abs(iq).max()
+    iq *= 0.707 / sFactor
 
     # Zero the last sample if needed
     if zeroLast:
         iq[-1] = 0 + 1j * 0
 
     if plot:
+        import matplotlib.pyplot as plt
+
         # Calculate symbol locations and symbol values for real and imaginary components
         symbolLocations = np.arange(0, len(iq), intermediateOsFactor)
         realSymbolValues = iq.real[symbolLocations]
@@ -2075,6 +2268,7 @@ def iq_correction(
     osFactor=4,
     thresh=0.4,
     convergence=2e-8,
+    timeout=60,
 ):
     """
     Creates a BPSK signal from a signal generator at a
@@ -2103,6 +2297,9 @@ def iq_correction(
         convergence (float): Equalizer convergence value. High values
             settle more quickly but may become unstable. Low values
             take longer to settle but tend to have better stability
+        timeout (float): Maximum time in seconds to wait for the EVM
+            to reach thresh. If it doesn't, a warning is issued and
+            the equalizer is extracted anyway.
 
     TODO
         Refactor using vsaControl
@@ -2146,7 +2343,7 @@ def iq_correction(
     vsa.write('trace2:data:name "Spectrum1"')
     vsa.write('trace3:data:name "Eq Impulse Response1"')
     vsa.write('trace4:data:name "Syms/Errs1"')
-    vsa.write("format:trace:data real64")  # This is float64/double, not int64
+    vsa.write("format:trace:data real32")  # This is float32/single, half the bytes of real64
     vsa.write(f"sense:frequency:center {cf}")
     vsa.write(f"sense:frequency:span {symRate * 1.5}")
     vsa.write("display:layout 2, 2")
@@ -2164,41 +2361,62 @@ def iq_correction(
     vsa.write("input:analog:range:auto")
     vsa.query("*opc?")
 
-    # Acquire data until EVM drops below a certain threshold
-    evm = 100
+    # Take a single acquisition to get a valid EVM reading
     vsa.write("initiate:continuous off")
-    while evm > thresh:
+    vsa.write("initiate:immediate")
+    vsa.query("*opc?")
+    evm = float(vsa.query('trace4:data:table? "EvmRms"').strip())
+
+    # Acquire data continuously until EVM drops below a certain threshold
+    # Polling a free-running measurement avoids a trigger and *opc? handshake for every acquisition
+    if evm > thresh:
+        deadline = monotonic() + timeout
+        vsa.write("initiate:continuous on")
         vsa.write("initiate:immediate")
+        while evm > thresh:
+            if monotonic() > deadline:
+                warnings.warn(f"EVM did not reach {thresh} within {timeout} seconds. Extracting equalizer anyway.")
+                break
+            sleep(0.1)
+            evm = float(vsa.query('trace4:data:table? "EvmRms"').strip())
+
+        # Let the acquisition in progress finish and stop so the equalizer doesn't change while it's read
+        vsa.write("initiate:continuous off")
         vsa.query("*opc?")
-        evm = float(vsa.query('trace4:data:table? "EvmRms"').strip())
 
     vsa.write('trace3:format "IQ"')
-    eqI = vsa.binblockread("trace3:data:x?", datatype="d").byteswap()
-    eqQ = vsa.binblockread("trace3:data:y?", datatype="d").byteswap()
+    # Equalizer taps are unit-scaled, so float32 transfer is plenty and halves the socket traffic
+    eqI = vsa.binblockread("trace3:data:x?", datatype="f").byteswap().astype(np.float64)
+    eqQ = vsa.binblockread("trace3:data:y?", datatype="f").byteswap().astype(np.float64)
     vsa.write("ddemod:compensate:equalize 0")
 
     # Invert the phase of the equalizer impulse response
     equalizer = np.array(eqI - eqQ * 1j)
 
-    # Pseudo circular convolution to mitigate zeroing of samples due to filter delay
-    # iq = np.array(i + q*1j)
+    # Circular convolution via FFT so the waveform wraps around seamlessly with no padding or trimming
     taps = len(equalizer)
-    circIQ = np.concatenate((iq[-int(taps / 2) :], iq, iq[: int(taps / 2)]))
-
-    # Apply filter, trim off delayed samples, and normalize
-    iqCorr = np.convolve(equalizer, circIQ)
-    iqCorr = iqCorr[taps - 1 : -taps + 1]
-    sFactor = abs(np.amax(iqCorr))
-    iqCorr = iqCorr / sFactor * 0.707
+    if taps > len(iq):
+        raise error.WfmBuilderError("Waveform must be at least as long as the equalizer impulse response.")
+
+    # Remove the filter delay so the corrected waveform lines up with the original by circularly shifting the
+    # zero-padded equalizer, which avoids rolling a full-length copy of the result
+    delay = taps - 1 - taps // 2
+    eqPadded = np.zeros(len(iq), dtype=complex)
+    eqPadded[: taps - delay] = equalizer[delay:]
+    eqPadded[len(iq) - delay :] = equalizer[:delay]
+
+    # Multiply the spectra and transform back in place to keep the number of full-length temporaries down
+    iqCorr = scipy.fft.fft(np.asarray(iq, dtype=complex))
+    iqCorr *= scipy.fft.fft(eqPadded, overwrite_x=True)
+    iqCorr = scipy.fft.ifft(iqCorr, overwrite_x=True)
+    sFactor = np.abs(iqCorr).max()
+    iqCorr *= 0.707 / sFactor
 
     # import matplotlib.pyplot as plt
     #
     # plt.subplot(221)
     # plt.plot(iq.real)
     # plt.plot(iq.imag)
-    # plt.subplot(222)
-    # plt.plot(circIQ.real)
-    # plt.plot(circIQ.imag)
     # plt.subplot(223)
     # plt.plot(equalizer.real)
     # plt.plot(equalizer.imag)